@@ -0,0 +1,3 @@
+-- 내 북마크 목록 keyset 페이지네이션용 인덱스 (정렬 키와 동일한 순서)
+CREATE INDEX IF NOT EXISTS idx_user_bookmarks_user_created
+  ON user_bookmarks (user_id, created_at DESC, topic_id DESC);
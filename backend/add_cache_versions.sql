@@ -0,0 +1,11 @@
+-- 컬렉션 단위 버전 스탬프 테이블 (ETag / 메모리 캐시 무효화용)
+CREATE TABLE IF NOT EXISTS cache_versions (
+  name VARCHAR(50) PRIMARY KEY,
+  version BIGINT NOT NULL DEFAULT 0,
+  updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+INSERT INTO cache_versions (name, version) VALUES
+  ('categories', 1),
+  ('templates', 1)
+ON CONFLICT (name) DO NOTHING;
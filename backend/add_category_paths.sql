@@ -0,0 +1,21 @@
+-- 카테고리 계층 인덱스 (materialized path: "/1/5/", depth)
+ALTER TABLE categories ADD COLUMN IF NOT EXISTS path TEXT NOT NULL DEFAULT '';
+ALTER TABLE categories ADD COLUMN IF NOT EXISTS depth INTEGER NOT NULL DEFAULT 0;
+
+-- 기존 카테고리 경로 채우기
+WITH RECURSIVE tree AS (
+  SELECT id, '/' || id || '/' AS path, 0 AS depth
+  FROM categories
+  WHERE parent_id IS NULL
+  UNION ALL
+  SELECT c.id, t.path || c.id || '/', t.depth + 1
+  FROM categories c
+  JOIN tree t ON c.parent_id = t.id
+)
+UPDATE categories c
+SET path = tree.path, depth = tree.depth
+FROM tree
+WHERE c.id = tree.id;
+
+-- 접두사(LIKE '/1/5/%') 검색용 인덱스
+CREATE INDEX IF NOT EXISTS idx_categories_path ON categories (path text_pattern_ops);
@@ -0,0 +1,3 @@
+-- 기존 댓글 좋아요 수 채우기 (좋아요 토글 시 함께 갱신되기 전의 데이터, 이후 불일치 시 `python reconcile_counters.py` 실행)
+UPDATE comments
+SET likes_count = (SELECT count(*) FROM comment_likes WHERE comment_likes.comment_id = comments.id);
@@ -0,0 +1,7 @@
+-- 댓글 페이지네이션용 인덱스 (최상위 댓글 / 답글, 정렬 키와 동일한 순서)
+CREATE INDEX IF NOT EXISTS idx_comments_topic_threads
+  ON comments (topic_id, created_at DESC, id DESC)
+  WHERE parent_comment_id IS NULL;
+
+CREATE INDEX IF NOT EXISTS idx_comments_parent_order
+  ON comments (parent_comment_id, created_at DESC, id DESC);
@@ -0,0 +1,6 @@
+-- topics 테이블에 비정규화 댓글 수 컬럼 추가
+ALTER TABLE topics ADD COLUMN IF NOT EXISTS comments_count INTEGER DEFAULT 0;
+
+-- 기존 데이터 채우기 (이후 불일치 시 `python reconcile_counters.py` 실행)
+UPDATE topics
+SET comments_count = (SELECT count(*) FROM comments WHERE comments.topic_id = topics.id);
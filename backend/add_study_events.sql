@@ -0,0 +1,29 @@
+-- 학습 이벤트 로그 (회독/북마크/메모, occurred_at 기준 월별 파티션)
+-- 월별 파티션은 서버의 compactor가 미리 생성하며, 그 전에 들어온 행은 기본 파티션에 저장됨
+CREATE TABLE IF NOT EXISTS study_events (
+  id BIGSERIAL,
+  occurred_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+  user_id UUID NOT NULL,
+  topic_id INTEGER,
+  category_id INTEGER,
+  event_type VARCHAR(20) NOT NULL,  -- 'read', 'bookmark', 'note'
+  amount INTEGER NOT NULL DEFAULT 1,
+  compacted BOOLEAN NOT NULL DEFAULT FALSE,
+  PRIMARY KEY (id, occurred_at)
+) PARTITION BY RANGE (occurred_at);
+
+CREATE TABLE IF NOT EXISTS study_events_default PARTITION OF study_events DEFAULT;
+
+CREATE INDEX IF NOT EXISTS idx_study_events_pending ON study_events (occurred_at) WHERE NOT compacted;
+
+-- 사용자/일/카테고리별 합계 (진도 API용)
+CREATE TABLE IF NOT EXISTS study_daily_rollups (
+  user_id UUID NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+  day DATE NOT NULL,
+  category_id INTEGER NOT NULL DEFAULT 0,  -- 카테고리 없음 = 0
+  reads INTEGER NOT NULL DEFAULT 0,
+  bookmarks INTEGER NOT NULL DEFAULT 0,
+  notes INTEGER NOT NULL DEFAULT 0,
+  updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+  PRIMARY KEY (user_id, day, category_id)
+);
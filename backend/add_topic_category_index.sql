@@ -0,0 +1,2 @@
+-- 카테고리별(하위 트리 포함) 서브노트 목록 조회용 인덱스
+CREATE INDEX IF NOT EXISTS idx_topics_category_order ON topics (category_id, order_index, created_at DESC, id);
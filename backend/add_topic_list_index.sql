@@ -0,0 +1,2 @@
+-- 서브노트 목록 keyset 페이지네이션용 인덱스 (정렬 키와 동일한 순서)
+CREATE INDEX IF NOT EXISTS idx_topics_list_order ON topics (order_index, created_at DESC, id);
@@ -0,0 +1,7 @@
+-- topics 전문 검색용 tsvector 컬럼 및 GIN 인덱스 추가
+-- 값은 애플리케이션(app/services/topic_search.py)에서 한글 bi-gram 토큰으로 생성
+ALTER TABLE topics ADD COLUMN IF NOT EXISTS search_vector TSVECTOR;
+
+CREATE INDEX IF NOT EXISTS idx_topics_search_vector ON topics USING GIN (search_vector);
+
+-- 기존 데이터 색인: 실행 후 `python reindex_topic_search.py` 실행
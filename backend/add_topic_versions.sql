@@ -0,0 +1,15 @@
+-- 서브노트 수정 이력 (N번째마다 스냅샷, 그 사이는 delta)
+CREATE TABLE IF NOT EXISTS topic_versions (
+  id SERIAL PRIMARY KEY,
+  topic_id INTEGER NOT NULL REFERENCES topics(id) ON DELETE CASCADE,
+  version INTEGER NOT NULL,
+  is_snapshot BOOLEAN NOT NULL DEFAULT FALSE,
+  title VARCHAR(200) NOT NULL,
+  keywords VARCHAR(500),
+  mnemonic TEXT,
+  content_data TEXT NOT NULL,  -- 스냅샷: 전체 본문, 그 외: JSON delta
+  content_length INTEGER NOT NULL DEFAULT 0,
+  created_by UUID REFERENCES users(id) ON DELETE SET NULL,
+  created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+  CONSTRAINT uq_topic_versions_topic_version UNIQUE (topic_id, version)
+);
@@ -0,0 +1,4 @@
+-- 토픽 변경 버전 스탬프 (카테고리별 토픽 수 등 집계 캐시 무효화용)
+INSERT INTO cache_versions (name, version) VALUES
+  ('topics', 1)
+ON CONFLICT (name) DO NOTHING;
@@ -4,9 +4,11 @@ from sqlalchemy.orm import Session
 from app.core.database import get_db
 from app.core.security import verify_token
 from app.models.user import User
+from typing import Optional
 from uuid import UUID
 
 security = HTTPBearer()
+optional_security = HTTPBearer(auto_error=False)
 
 
 async def get_current_user(
@@ -54,6 +56,24 @@ async def get_current_user(
     return user
 
 
+async def require_admin_credentials(
+    credentials: Optional[HTTPAuthorizationCredentials],
+    db: Session
+) -> User:
+    """
+    공개 API에서 관리자 전용 옵션을 요청했을 때만 호출하는 관리자 확인
+
+    공개 경로는 토큰이 없거나 잘못되어도 그대로 응답해야 하므로 의존성 대신 해당 분기에서만 사용자 조회
+    """
+    if credentials is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return await require_admin(await get_current_user(credentials, db))
+
+
 async def require_student(
     current_user: User = Depends(get_current_user)
 ) -> User:
@@ -1,28 +1,118 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
-from typing import List
+from sqlalchemy import and_
+from typing import Dict, List, Optional
 
 from app.core.database import get_db
+from app.core.pagination import (
+    NEXT_CURSOR_HEADER, encode_cursor, decode_cursor, cursor_int, cursor_datetime, nullable, keyset_order, keyset_filter
+)
 from app.api.deps import get_current_user
 from app.models.user import User
 from app.models.bookmark import UserBookmark
 from app.models.topic import Topic
-from app.schemas.bookmark import BookmarkCreate, BookmarkResponse
+from app.models.category import Category
+from app.models.read_count import UserReadCount
+from app.services.study_events import BOOKMARK, record_event
+from app.services import bookmark_cache
+from app.schemas.bookmark import BookmarkCreate, BookmarkListItem
+from app.schemas.topic import CategoryInfo
 
 router = APIRouter(prefix="/api/bookmarks", tags=["bookmarks"])
 
+# 일괄 확인 한 번에 받을 수 있는 최대 토픽 수
+MAX_CHECK_TOPICS = 500
 
-@router.get("", response_model=List[BookmarkResponse])
+# cursor만 지정했을 때의 북마크 목록 페이지 크기
+DEFAULT_PAGE_SIZE = 100
+
+
+_list_adapter = TypeAdapter(List[BookmarkListItem])
+
+
+# 북마크 목록 정렬 키: (created_at DESC, topic_id DESC) - idx_user_bookmarks_user_created와 일치
+BOOKMARK_LIST_KEYS = ((UserBookmark.created_at, True), (UserBookmark.topic_id, True))
+
+
+def bookmark_seek_filter(cursor: str):
+    """커서 위치 이후의 북마크만 조회하는 keyset 조건 (created_at DESC, topic_id DESC)"""
+    values = decode_cursor(cursor, nullable(cursor_datetime), cursor_int)
+    return keyset_filter(BOOKMARK_LIST_KEYS, values)
+
+
+def to_bookmark_item(row) -> BookmarkListItem:
+    """projection 행 -> BookmarkListItem (DB에서 읽은 값이므로 검증 없이 생성)"""
+    category = None
+    if row.category_id is not None and row.category_name is not None:
+        category = CategoryInfo.model_construct(id=row.category_id, name=row.category_name)
+
+    return BookmarkListItem.model_construct(
+        user_id=row.user_id,
+        topic_id=row.topic_id,
+        created_at=row.created_at,
+        title=row.title,
+        category_id=row.category_id,
+        category=category,
+        importance_level=row.importance_level,
+        is_published=row.is_published,
+        read_count=row.read_count or 0,
+        last_read_at=row.last_read_at,
+    )
+
+
+@router.get("", response_model=List[BookmarkListItem])
 async def get_my_bookmarks(
+    cursor: Optional[str] = Query(None),
+    limit: Optional[int] = Query(None, ge=1, le=500),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """내 북마크 목록 조회"""
-    bookmarks = db.query(UserBookmark).filter(
+    """
+    내 북마크 목록 조회 (최근 추가 순, 토픽 요약 + 내 회독 수 포함)
+
+    토픽/카테고리/회독 카운트를 한 번의 JOIN projection으로 조회 (본문 제외)
+    - cursor, limit 둘 다 없으면 기존처럼 전체 반환
+    - limit: 페이지 크기 (cursor만 있으면 DEFAULT_PAGE_SIZE)
+    - cursor: 이전 응답의 X-Next-Cursor 헤더 값 (keyset 페이지네이션)
+    """
+    query = db.query(
+        UserBookmark.user_id,
+        UserBookmark.topic_id,
+        UserBookmark.created_at,
+        Topic.title,
+        Topic.category_id,
+        Category.name.label("category_name"),
+        Topic.importance_level,
+        Topic.is_published,
+        UserReadCount.count.label("read_count"),
+        UserReadCount.last_read_at
+    ).join(
+        Topic, Topic.id == UserBookmark.topic_id
+    ).outerjoin(
+        Category, Category.id == Topic.category_id
+    ).outerjoin(
+        UserReadCount,
+        and_(UserReadCount.user_id == UserBookmark.user_id, UserReadCount.topic_id == UserBookmark.topic_id)
+    ).filter(
         UserBookmark.user_id == current_user.id
-    ).order_by(UserBookmark.created_at.desc()).all()
+    )
 
-    return bookmarks
+    if cursor is not None:
+        query = query.filter(bookmark_seek_filter(cursor))
+
+    query = query.order_by(*keyset_order(BOOKMARK_LIST_KEYS))
+    if cursor is not None and limit is None:
+        limit = DEFAULT_PAGE_SIZE
+    rows = query.limit(limit).all() if limit is not None else query.all()
+
+    # 페이지가 가득 찼다면 다음 페이지 커서 제공
+    headers = {}
+    if limit is not None and len(rows) == limit:
+        headers[NEXT_CURSOR_HEADER] = encode_cursor(rows[-1].created_at, rows[-1].topic_id)
+
+    body = _list_adapter.dump_json([to_bookmark_item(row) for row in rows])
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 @router.post("", status_code=status.HTTP_204_NO_CONTENT)
@@ -33,7 +123,7 @@ async def toggle_bookmark(
 ):
     """북마크 토글 (추가/제거)"""
     # 토픽 존재 확인
-    topic = db.query(Topic).filter(Topic.id == bookmark_data.topic_id).first()
+    topic = db.query(Topic.id).filter(Topic.id == bookmark_data.topic_id).first()
     if not topic:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -49,6 +139,7 @@ async def toggle_bookmark(
     if existing_bookmark:
         # 북마크 제거
         db.delete(existing_bookmark)
+        record_event(db, current_user.id, bookmark_data.topic_id, BOOKMARK, amount=-1)
     else:
         # 북마크 추가
         new_bookmark = UserBookmark(
@@ -56,11 +147,43 @@ async def toggle_bookmark(
             topic_id=bookmark_data.topic_id
         )
         db.add(new_bookmark)
+        record_event(db, current_user.id, bookmark_data.topic_id, BOOKMARK)
 
     db.commit()
+    bookmark_cache.invalidate(current_user.id)
     return None
 
 
+@router.get("/ids", response_model=List[int])
+async def get_my_bookmark_ids(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """내 북마크 토픽 id 전체 (목록 화면의 북마크 표시용, 오름차순)"""
+    return sorted(bookmark_cache.get_bookmark_ids(db, current_user.id))
+
+
+@router.get("/check", response_model=Dict[int, bool])
+async def check_bookmarks(
+    topic_ids: List[int] = Query(..., alias="topic_id"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    여러 토픽의 북마크 여부 일괄 확인 (?topic_id=1&topic_id=2...)
+
+    토픽 카드마다 /check/{topic_id}를 호출하는 대신 한 번의 요청으로 처리
+    """
+    if len(topic_ids) > MAX_CHECK_TOPICS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Too many topic ids (max {MAX_CHECK_TOPICS})"
+        )
+
+    bookmarked = bookmark_cache.get_bookmark_ids(db, current_user.id)
+    return {topic_id: topic_id in bookmarked for topic_id in topic_ids}
+
+
 @router.get("/check/{topic_id}", response_model=bool)
 async def check_bookmark(
     topic_id: int,
@@ -68,9 +191,4 @@ async def check_bookmark(
     current_user: User = Depends(get_current_user)
 ):
     """특정 토픽 북마크 여부 확인"""
-    bookmark = db.query(UserBookmark).filter(
-        UserBookmark.user_id == current_user.id,
-        UserBookmark.topic_id == topic_id
-    ).first()
-
-    return bookmark is not None
+    return topic_id in bookmark_cache.get_bookmark_ids(db, current_user.id)
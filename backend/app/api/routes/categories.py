@@ -1,54 +1,77 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
+from fastapi.security import HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 
 from app.core.database import get_db
+from app.core.http_cache import make_etag, cache_headers, is_not_modified, not_modified_response
+from app.core.version_stamp import CATEGORIES, TOPICS, bump_version, get_version
+from app.services import category_tree
+from app.services.category_hierarchy import (
+    assign_path, move_subtree, is_in_subtree, descendants_query, ancestors_query, apply_bulk_moves
+)
 from app.models.category import Category
 from app.models.user import User
-from app.schemas.category import CategoryCreate, CategoryUpdate, CategoryResponse, CategoryTree, CategoryReorder
-from app.api.deps import require_admin
+from app.schemas.category import (
+    CategoryCreate, CategoryUpdate, CategoryResponse, CategoryTree, CategoryReorder,
+    CategoryBulkMove, CategoryBulkMoveResult
+)
+from app.api.deps import require_admin, require_admin_credentials, optional_security
 
 router = APIRouter()
 
 
-def build_category_tree(categories: List[Category], parent_id: int = None) -> List[CategoryTree]:
+@router.get("/tree", response_model=List[CategoryTree])
+async def get_category_tree(
+    request: Request,
+    with_counts: bool = Query(False),
+    include_unpublished: bool = Query(False),
+    db: Session = Depends(get_db),
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security)
+):
     """
-    재귀적으로 카테고리 트리 구조 생성
+    트리 구조로 모든 카테고리 조회 (변경이 없으면 304)
+
+    트리는 카테고리 버전 스탬프 단위로 한 번만 구성/직렬화되어 메모리에 캐시됨
+    - with_counts: 노드별 topic_count, subtree_topic_count, max_importance_level 포함 (공개 토픽 기준)
+    - include_unpublished: 비공개 토픽까지 집계 (관리자만)
+
+    공개 API이므로 토큰은 include_unpublished일 때만 확인 (만료/잘못된 토큰이 있어도 기본 트리는 200)
     """
-    tree = []
-    for category in categories:
-        if category.parent_id == parent_id:
-            children = build_category_tree(categories, category.id)
-            cat_dict = {
-                "id": category.id,
-                "name": category.name,
-                "description": category.description,
-                "parent_id": category.parent_id,
-                "order_index": category.order_index,
-                "created_at": category.created_at,
-                "children": children
-            }
-            tree.append(CategoryTree(**cat_dict))
+    if include_unpublished:
+        await require_admin_credentials(credentials, db)
 
-    # order_index로 정렬
-    tree.sort(key=lambda x: x.order_index)
-    return tree
+    version, updated_at = get_version(db, CATEGORIES)
+    if with_counts:
+        topics_version, topics_updated_at = get_version(db, TOPICS)
+        etag = make_etag("categories-tree", version, "counts", topics_version, include_unpublished)
+        updated_at = max(filter(None, (updated_at, topics_updated_at)), default=None)
+    else:
+        etag = make_etag("categories-tree", version)
 
+    headers = cache_headers(etag, updated_at)
+    if is_not_modified(request, headers["ETag"], updated_at):
+        return not_modified_response(headers)
 
-@router.get("/tree", response_model=List[CategoryTree])
-async def get_category_tree(db: Session = Depends(get_db)):
-    """
-    트리 구조로 모든 카테고리 조회
-    """
-    categories = db.query(Category).all()
-    return build_category_tree(categories)
+    # 버전이 같으면 메모리에 캐시된 직렬화 트리를 그대로 반환
+    if with_counts:
+        payload = category_tree.get_category_tree_with_counts(db, version, topics_version, include_unpublished)
+    else:
+        payload = category_tree.get_category_tree(db, version).payload
+    return Response(content=payload, media_type="application/json", headers=headers)
 
 
 @router.get("/", response_model=List[CategoryResponse])
-async def get_categories(db: Session = Depends(get_db)):
+async def get_categories(request: Request, response: Response, db: Session = Depends(get_db)):
     """
-    평면 리스트로 모든 카테고리 조회
+    평면 리스트로 모든 카테고리 조회 (변경이 없으면 304)
     """
+    version, updated_at = get_version(db, CATEGORIES)
+    headers = cache_headers(make_etag("categories", version), updated_at)
+    if is_not_modified(request, headers["ETag"], updated_at):
+        return not_modified_response(headers)
+
+    response.headers.update(headers)
     categories = db.query(Category).order_by(Category.order_index).all()
     return categories
 
@@ -64,6 +87,28 @@ async def get_category(category_id: int, db: Session = Depends(get_db)):
     return category
 
 
+@router.get("/{category_id}/descendants", response_model=List[CategoryResponse])
+async def get_category_descendants(category_id: int, db: Session = Depends(get_db)):
+    """
+    모든 하위 카테고리 조회 (깊이 순, 경로 인덱스로 한 번에 조회)
+    """
+    category = db.query(Category).filter(Category.id == category_id).first()
+    if not category:
+        raise HTTPException(status_code=404, detail="Category not found")
+    return descendants_query(db, category).all()
+
+
+@router.get("/{category_id}/ancestors", response_model=List[CategoryResponse])
+async def get_category_ancestors(category_id: int, db: Session = Depends(get_db)):
+    """
+    모든 상위 카테고리 조회 (루트부터)
+    """
+    category = db.query(Category).filter(Category.id == category_id).first()
+    if not category:
+        raise HTTPException(status_code=404, detail="Category not found")
+    return ancestors_query(db, category).all()
+
+
 @router.post("/", response_model=CategoryResponse, status_code=status.HTTP_201_CREATED)
 async def create_category(
     category_data: CategoryCreate,
@@ -74,6 +119,7 @@ async def create_category(
     새 카테고리 생성 (관리자만)
     """
     # parent_id가 있다면 존재하는지 확인
+    parent = None
     if category_data.parent_id:
         parent = db.query(Category).filter(Category.id == category_data.parent_id).first()
         if not parent:
@@ -96,6 +142,8 @@ async def create_category(
 
     category = Category(**category_data.model_dump())
     db.add(category)
+    assign_path(db, category, parent)
+    bump_version(db, CATEGORIES)
     db.commit()
     db.refresh(category)
     return category
@@ -115,31 +163,31 @@ async def update_category(
     if not category:
         raise HTTPException(status_code=404, detail="Category not found")
 
-    # parent_id가 변경되었다면 순환 참조 확인
-    if category_data.parent_id is not None and category_data.parent_id != category.parent_id:
+    update_data = category_data.model_dump(exclude_unset=True)
+
+    # parent_id가 변경되었다면 순환 참조 확인 후 하위 트리 경로까지 함께 이동
+    new_parent_id = update_data.pop("parent_id", category.parent_id)
+    if new_parent_id != category.parent_id:
         # 자기 자신을 부모로 설정할 수 없음
-        if category_data.parent_id == category_id:
+        if new_parent_id == category_id:
             raise HTTPException(status_code=400, detail="Category cannot be its own parent")
 
-        # 자식 카테고리를 부모로 설정할 수 없음 (순환 참조 방지)
-        def is_descendant(potential_parent_id: int, category_id: int) -> bool:
-            if potential_parent_id is None:
-                return False
-            parent = db.query(Category).filter(Category.id == potential_parent_id).first()
-            if not parent:
-                return False
-            if parent.id == category_id:
-                return True
-            return is_descendant(parent.parent_id, category_id)
+        new_parent = None
+        if new_parent_id is not None:
+            new_parent = db.query(Category).filter(Category.id == new_parent_id).first()
+            if not new_parent:
+                raise HTTPException(status_code=404, detail="Parent category not found")
+            # 자식 카테고리를 부모로 설정할 수 없음 (경로 접두사로 판단)
+            if is_in_subtree(category, new_parent):
+                raise HTTPException(status_code=400, detail="Cannot create circular reference")
 
-        if is_descendant(category_data.parent_id, category_id):
-            raise HTTPException(status_code=400, detail="Cannot create circular reference")
+        move_subtree(db, category, new_parent)
 
     # 업데이트
-    update_data = category_data.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(category, field, value)
 
+    bump_version(db, CATEGORIES)
     db.commit()
     db.refresh(category)
     return category
@@ -168,6 +216,7 @@ async def delete_category(
         )
 
     db.delete(category)
+    bump_version(db, CATEGORIES)
     db.commit()
 
 
@@ -179,12 +228,28 @@ async def reorder_categories(
 ):
     """
     카테고리 순서 변경 (drag & drop 지원)
-    """
-    for item in reorder_data:
-        category = db.query(Category).filter(Category.id == item.id).first()
-        if category:
-            category.parent_id = item.parent_id
-            category.order_index = item.order_index
 
+    전체 결과 트리를 검증한 뒤 한 번에 반영 (/bulk-move와 동일)
+    """
+    apply_bulk_moves(db, reorder_data)
+    bump_version(db, CATEGORIES)
     db.commit()
     return {"message": "Categories reordered successfully"}
+
+
+@router.post("/bulk-move", response_model=CategoryBulkMoveResult)
+async def bulk_move_categories(
+    bulk_data: CategoryBulkMove,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_admin)
+):
+    """
+    여러 카테고리의 부모/순서를 한 트랜잭션으로 변경 (관리자만)
+
+    없는 카테고리/부모, 순환 참조, 같은 부모 아래 중복 이름이 하나라도 있으면 아무것도 반영하지 않음
+    """
+    updated = apply_bulk_moves(db, bulk_data.moves)
+    if updated:
+        bump_version(db, CATEGORIES)
+    db.commit()
+    return CategoryBulkMoveResult(updated=updated)
@@ -1,48 +1,199 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session, joinedload
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session, joinedload, aliased
+from sqlalchemy import delete, func, literal, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert, UUID as PG_UUID
+import asyncio
+import json
+from typing import List, Optional, Set
 from uuid import UUID
 
+from app.core.config import settings
 from app.core.database import get_db
+from app.core.events import topic_events
+from app.core.pagination import encode_cursor, decode_cursor, cursor_int, cursor_datetime, nullable, keyset_order, keyset_filter
 from app.api.deps import get_current_user
 from app.models.user import User
 from app.models.comment import Comment, CommentLike
-from app.schemas.comment import CommentCreate, CommentUpdate, CommentResponse, CommentUserInfo
+from app.models.topic import Topic
+from app.schemas.comment import (
+    CommentCreate, CommentUpdate, CommentResponse, CommentUserInfo, CommentThread, CommentPage,
+    CommentLikeResult
+)
 
 router = APIRouter(prefix="/api/topics/{topic_id}/comments", tags=["comments"])
 
 
-def build_comment_tree(comments: List[Comment], current_user_id: UUID, parent_id: int = None) -> List[CommentResponse]:
-    """재귀적으로 댓글 트리 구조 생성"""
-    result = []
+def adjust_comments_count(db: Session, topic_id: int, delta: int) -> None:
+    """토픽의 비정규화 댓글 수를 원자적으로 증감 (updated_at은 유지)"""
+    db.query(Topic).filter(Topic.id == topic_id).update(
+        {
+            Topic.comments_count: func.coalesce(Topic.comments_count, 0) + delta,
+            Topic.updated_at: Topic.updated_at,
+        },
+        synchronize_session=False
+    )
+
+
+def liked_comment_ids(db: Session, user_id: UUID, topic_id: int) -> Set[int]:
+    """토픽 댓글 중 사용자가 좋아요한 댓글 id (다른 사용자의 좋아요 행은 읽지 않음)"""
+    rows = db.query(CommentLike.comment_id).join(
+        Comment, Comment.id == CommentLike.comment_id
+    ).filter(
+        CommentLike.user_id == user_id,
+        Comment.topic_id == topic_id
+    ).all()
+    return {row.comment_id for row in rows}
 
+
+def to_comment_response(comment: Comment, is_liked: bool, model=CommentResponse, **extra):
+    """DB에서 읽은 댓글 -> 응답 (답글은 비어 있는 상태)"""
+    return model.model_construct(
+        id=comment.id,
+        topic_id=comment.topic_id,
+        user_id=comment.user_id,
+        parent_comment_id=comment.parent_comment_id,
+        content=comment.content,
+        likes_count=comment.likes_count,
+        created_at=comment.created_at,
+        updated_at=comment.updated_at,
+        user=CommentUserInfo.model_construct(
+            id=comment.user.id,
+            name=comment.user.name,
+            cohort=comment.user.cohort,
+            role=comment.user.role
+        ),
+        replies=[],
+        is_liked=is_liked,
+        **extra
+    )
+
+
+def build_comment_tree(comments: List[Comment], liked_ids: Set[int]) -> List[CommentResponse]:
+    """
+    parent_comment_id 인덱스로 한 번에 댓글 트리 구조 생성 (입력 순서 유지)
+
+    부모가 목록에 없는 답글은 기존과 같이 트리에서 제외
+    """
+    responses = {
+        comment.id: to_comment_response(comment, comment.id in liked_ids)
+        for comment in comments
+    }
+
+    roots = []
     for comment in comments:
-        if comment.parent_comment_id == parent_id:
-            # 현재 사용자가 좋아요 했는지 확인
-            is_liked = any(like.user_id == current_user_id for like in comment.likes)
-
-            # 댓글 응답 생성
-            comment_response = CommentResponse(
-                id=comment.id,
-                topic_id=comment.topic_id,
-                user_id=comment.user_id,
-                parent_comment_id=comment.parent_comment_id,
-                content=comment.content,
-                likes_count=comment.likes_count,
-                created_at=comment.created_at,
-                updated_at=comment.updated_at,
-                user=CommentUserInfo(
-                    id=comment.user.id,
-                    name=comment.user.name,
-                    cohort=comment.user.cohort,
-                    role=comment.user.role
-                ),
-                replies=build_comment_tree(comments, current_user_id, comment.id),
-                is_liked=is_liked
+        response = responses[comment.id]
+        if comment.parent_comment_id is None:
+            roots.append(response)
+        else:
+            parent = responses.get(comment.parent_comment_id)
+            if parent is not None:
+                parent.replies.append(response)
+
+    return roots
+
+
+def toggle_like_statement(topic_id: int, comment_id: int, user_id: UUID):
+    """
+    좋아요 토글 + likes_count 증감을 하나의 SQL 문으로 (읽고 쓰는 사이의 경쟁 상태 없음)
+
+    WITH removed AS (DELETE ... RETURNING),
+         added AS (INSERT ... WHERE NOT EXISTS removed ON CONFLICT DO NOTHING RETURNING)
+    UPDATE comments SET likes_count = likes_count + |added| - |removed| RETURNING likes_count, is_liked
+    댓글이 해당 토픽에 없으면 아무것도 변경하지 않고 행을 반환하지 않음
+    """
+    comment_in_topic = select(Comment.id).where(
+        Comment.id == comment_id,
+        Comment.topic_id == topic_id
+    )
+
+    removed = delete(CommentLike).where(
+        CommentLike.user_id == user_id,
+        CommentLike.comment_id == comment_id,
+        comment_in_topic.exists()
+    ).returning(CommentLike.comment_id).cte("removed")
+
+    added = pg_insert(CommentLike).from_select(
+        ["user_id", "comment_id"],
+        select(literal(user_id, PG_UUID(as_uuid=True)), Comment.id).where(
+            Comment.id == comment_id,
+            Comment.topic_id == topic_id,
+            ~select(removed.c.comment_id).exists()
+        )
+    ).on_conflict_do_nothing().returning(CommentLike.comment_id).cte("added")
+
+    delta = (
+        select(func.count()).select_from(added).scalar_subquery()
+        - select(func.count()).select_from(removed).scalar_subquery()
+    )
+
+    return (
+        update(Comment)
+        .where(Comment.id == comment_id, Comment.topic_id == topic_id)
+        .values(
+            likes_count=func.greatest(func.coalesce(Comment.likes_count, 0) + delta, 0),
+            # 좋아요는 댓글 수정이 아니므로 updated_at 유지
+            updated_at=Comment.updated_at,
+        )
+        .returning(Comment.likes_count, select(added.c.comment_id).exists().label("is_liked"))
+    )
+
+
+def publish_comment_event(db: Session, topic_id: int, event_type: str, comment: CommentResponse) -> None:
+    """댓글 생성/수정 이벤트 발행 (is_liked는 사용자마다 다르므로 제외)"""
+    topic_events.publish(db, topic_id, event_type, comment.model_dump(mode="json", exclude={"is_liked", "replies"}))
+
+
+def format_sse(event_type: str, data: dict) -> str:
+    payload = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+    return f"event: {event_type}\ndata: {payload}\n\n"
+
+
+# 댓글 정렬 키: (created_at DESC, id DESC) - idx_comments_topic_threads / idx_comments_parent_order와 일치
+COMMENT_PAGE_KEYS = ((Comment.created_at, True), (Comment.id, True))
+
+
+def comment_seek_filter(cursor: str):
+    """커서 위치 이후의 댓글만 조회하는 keyset 조건 (created_at DESC, id DESC)"""
+    values = decode_cursor(cursor, nullable(cursor_datetime), cursor_int)
+    return keyset_filter(COMMENT_PAGE_KEYS, values)
+
+
+def comment_page(db: Session, query, cursor: Optional[str], limit: int, current_user_id: UUID) -> CommentPage:
+    """
+    댓글 한 페이지 + 답글 수 + 내 좋아요 여부
+
+    작성자는 many-to-one JOIN, 좋아요는 페이지 댓글에 대한 내 좋아요만 별도 조회
+    """
+    replies = aliased(Comment)
+    reply_count = select(func.count(replies.id)).where(
+        replies.parent_comment_id == Comment.id
+    ).correlate(Comment).scalar_subquery()
+
+    query = query.add_columns(reply_count.label("reply_count")).options(joinedload(Comment.user))
+    if cursor is not None:
+        query = query.filter(comment_seek_filter(cursor))
+    rows = query.order_by(*keyset_order(COMMENT_PAGE_KEYS)).limit(limit).all()
+
+    liked_ids = set()
+    if rows:
+        liked_ids = {
+            row.comment_id for row in db.query(CommentLike.comment_id).filter(
+                CommentLike.user_id == current_user_id,
+                CommentLike.comment_id.in_([comment.id for comment, _ in rows])
             )
-            result.append(comment_response)
+        }
 
-    return result
+    items = [
+        to_comment_response(comment, comment.id in liked_ids, model=CommentThread, reply_count=count)
+        for comment, count in rows
+    ]
+
+    next_cursor = None
+    if len(rows) == limit:
+        last = rows[-1][0]
+        next_cursor = encode_cursor(last.created_at, last.id)
+    return CommentPage(items=items, next_cursor=next_cursor)
 
 
 @router.get("", response_model=List[CommentResponse])
@@ -52,16 +203,105 @@ async def get_comments(
     current_user: User = Depends(get_current_user)
 ):
     """토픽의 모든 댓글 조회 (트리 구조)"""
-    # 모든 댓글을 한 번에 가져오기 (N+1 문제 방지)
+    # 모든 댓글을 한 번에 가져오기 (N+1 문제 방지, 좋아요 행은 읽지 않음)
     comments = db.query(Comment).filter(
         Comment.topic_id == topic_id
     ).options(
-        joinedload(Comment.user),
-        joinedload(Comment.likes)
+        joinedload(Comment.user)
     ).order_by(Comment.created_at.desc()).all()
 
+    # 내가 좋아요한 댓글 id는 별도 쿼리 한 번으로 조회
+    liked_ids = liked_comment_ids(db, current_user.id, topic_id)
+
     # 트리 구조로 변환 (최상위 댓글만)
-    return build_comment_tree(comments, current_user.id, parent_id=None)
+    return build_comment_tree(comments, liked_ids)
+
+
+@router.get("/stream")
+async def stream_comment_events(
+    topic_id: int,
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    토픽 댓글 실시간 스트림 (Server-Sent Events)
+
+    이벤트: comment.created / comment.updated / comment.deleted / comment.liked
+    전체 목록을 다시 불러오지 않고 변경된 댓글만 반영할 수 있음
+    이벤트가 없으면 SSE_KEEPALIVE_SECONDS마다 주석(:)으로 연결 유지
+    없는 토픽이나 비공개 토픽(관리자 제외)은 구독하기 전에 404
+    """
+    topic = db.query(Topic.id, Topic.is_published).filter(Topic.id == topic_id).first()
+    if not topic or (not topic.is_published and current_user.role != "admin"):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Topic not found"
+        )
+
+    async def generate():
+        async with topic_events.subscribe(topic_id) as queue:
+            yield "retry: 3000\n\n"
+            while not await request.is_disconnected():
+                try:
+                    message = await asyncio.wait_for(queue.get(), timeout=settings.SSE_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+                yield format_sse(message["type"], message["data"])
+
+    return StreamingResponse(
+        generate(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@router.get("/threads", response_model=CommentPage)
+async def get_comment_threads(
+    topic_id: int,
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    최상위 댓글 페이지 조회 (최신순, 답글은 reply_count만 포함)
+
+    - cursor: 이전 응답의 next_cursor
+    - 답글은 /{comment_id}/replies로 따로 조회
+    """
+    query = db.query(Comment).filter(
+        Comment.topic_id == topic_id,
+        Comment.parent_comment_id.is_(None)
+    )
+    return comment_page(db, query, cursor, limit, current_user.id)
+
+
+@router.get("/{comment_id}/replies", response_model=CommentPage)
+async def get_comment_replies(
+    topic_id: int,
+    comment_id: int,
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    특정 댓글의 바로 아래 답글 페이지 조회 (최신순, 각 답글의 reply_count 포함)
+    """
+    parent = db.query(Comment.id).filter(
+        Comment.id == comment_id,
+        Comment.topic_id == topic_id
+    ).first()
+    if not parent:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Comment not found"
+        )
+
+    query = db.query(Comment).filter(Comment.parent_comment_id == comment_id)
+    return comment_page(db, query, cursor, limit, current_user.id)
 
 
 @router.post("", response_model=CommentResponse, status_code=status.HTTP_201_CREATED)
@@ -93,30 +333,16 @@ async def create_comment(
     )
 
     db.add(new_comment)
+    adjust_comments_count(db, topic_id, 1)
     db.commit()
     db.refresh(new_comment)
 
     # 사용자 정보 로드
     db.refresh(new_comment, ['user'])
 
-    return CommentResponse(
-        id=new_comment.id,
-        topic_id=new_comment.topic_id,
-        user_id=new_comment.user_id,
-        parent_comment_id=new_comment.parent_comment_id,
-        content=new_comment.content,
-        likes_count=new_comment.likes_count,
-        created_at=new_comment.created_at,
-        updated_at=new_comment.updated_at,
-        user=CommentUserInfo(
-            id=new_comment.user.id,
-            name=new_comment.user.name,
-            cohort=new_comment.user.cohort,
-            role=new_comment.user.role
-        ),
-        replies=[],
-        is_liked=False
-    )
+    response = to_comment_response(new_comment, is_liked=False)
+    publish_comment_event(db, topic_id, "comment.created", response)
+    return response
 
 
 @router.patch("/{comment_id}", response_model=CommentResponse)
@@ -151,28 +377,18 @@ async def update_comment(
     db.commit()
     db.refresh(comment)
 
-    # 사용자 정보 및 좋아요 로드
-    db.refresh(comment, ['user', 'likes'])
-    is_liked = any(like.user_id == current_user.id for like in comment.likes)
+    # 사용자 정보 로드, 좋아요 여부는 내 좋아요 행만 확인
+    db.refresh(comment, ['user'])
+    is_liked = db.query(
+        db.query(CommentLike).filter(
+            CommentLike.user_id == current_user.id,
+            CommentLike.comment_id == comment.id
+        ).exists()
+    ).scalar()
 
-    return CommentResponse(
-        id=comment.id,
-        topic_id=comment.topic_id,
-        user_id=comment.user_id,
-        parent_comment_id=comment.parent_comment_id,
-        content=comment.content,
-        likes_count=comment.likes_count,
-        created_at=comment.created_at,
-        updated_at=comment.updated_at,
-        user=CommentUserInfo(
-            id=comment.user.id,
-            name=comment.user.name,
-            cohort=comment.user.cohort,
-            role=comment.user.role
-        ),
-        replies=[],
-        is_liked=is_liked
-    )
+    response = to_comment_response(comment, is_liked=is_liked)
+    publish_comment_event(db, topic_id, "comment.updated", response)
+    return response
 
 
 @router.delete("/{comment_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -201,48 +417,51 @@ async def delete_comment(
             detail="Not authorized to delete this comment"
         )
 
-    db.delete(comment)
+    # 하위 답글/좋아요는 DB의 ON DELETE CASCADE로 함께 삭제되므로 서브트리 전체 개수만큼 감소
+    subtree = select(Comment.id).where(Comment.id == comment_id).cte("subtree", recursive=True)
+    subtree = subtree.union_all(
+        select(Comment.id).where(Comment.parent_comment_id == subtree.c.id)
+    )
+    removed_count = db.execute(select(func.count()).select_from(subtree)).scalar()
+    parent_comment_id = comment.parent_comment_id
+
+    db.query(Comment).filter(Comment.id == comment_id).delete(synchronize_session=False)
+    adjust_comments_count(db, topic_id, -removed_count)
     db.commit()
 
+    topic_events.publish(db, topic_id, "comment.deleted", {
+        "id": comment_id,
+        "parent_comment_id": parent_comment_id,
+        "removed_count": removed_count,
+    })
     return None
 
 
-@router.post("/{comment_id}/like", status_code=status.HTTP_204_NO_CONTENT)
+@router.post("/{comment_id}/like", response_model=CommentLikeResult)
 async def toggle_comment_like(
     topic_id: int,
     comment_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """댓글 좋아요 토글"""
-    # 댓글 존재 확인
-    comment = db.query(Comment).filter(
-        Comment.id == comment_id,
-        Comment.topic_id == topic_id
-    ).first()
-
-    if not comment:
+    """
+    댓글 좋아요 토글
+
+    좋아요 행 추가/삭제와 likes_count 증감을 한 문장으로 처리하고 변경 후 상태 반환
+    """
+    result = db.execute(toggle_like_statement(topic_id, comment_id, current_user.id)).first()
+    if result is None:
+        db.rollback()
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Comment not found"
         )
 
-    # 기존 좋아요 확인
-    existing_like = db.query(CommentLike).filter(
-        CommentLike.user_id == current_user.id,
-        CommentLike.comment_id == comment_id
-    ).first()
-
-    if existing_like:
-        # 좋아요 취소
-        db.delete(existing_like)
-    else:
-        # 좋아요 추가
-        new_like = CommentLike(
-            user_id=current_user.id,
-            comment_id=comment_id
-        )
-        db.add(new_like)
-
     db.commit()
-    return None
+
+    # 좋아요 여부는 사용자마다 다르므로 이벤트에는 개수만 포함
+    topic_events.publish(db, topic_id, "comment.liked", {
+        "id": comment_id,
+        "likes_count": result.likes_count,
+    })
+    return CommentLikeResult(comment_id=comment_id, is_liked=result.is_liked, likes_count=result.likes_count)
@@ -0,0 +1,49 @@
+import hashlib
+
+from fastapi import APIRouter, Depends, Request, Response
+from sqlalchemy.orm import Session
+
+from app.core.database import get_db
+from app.core.compression import choose_encoding
+from app.core.config import settings
+from app.core.http_cache import make_etag, cache_headers, is_not_modified, not_modified_response
+from app.api.deps import get_current_user
+from app.models.user import User
+from app.schemas.home import HomeBundle
+from app.services.home_bundle import get_shared_bundle, user_overlay
+
+router = APIRouter(prefix="/api/home", tags=["home"])
+
+
+@router.get("", response_model=HomeBundle)
+async def get_home_bundle(
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    학생 앱 시작 화면 번들 (카테고리 트리 + 공개 토픽 요약 + 내 북마크/회독)
+
+    - 공용 부분은 버전 스탬프 단위로 미리 직렬화/압축해 두고 사용자별 부분만 매 요청 조회
+    - ETag는 응답 내용의 해시이므로 바뀐 것이 없으면 304
+    """
+    shared = get_shared_bundle(db)
+    overlay = user_overlay(db, current_user.id)
+
+    etag = make_etag("home", shared.digest, hashlib.sha1(overlay).hexdigest())
+    headers = cache_headers(etag)
+    if is_not_modified(request, etag):
+        return not_modified_response(headers)
+
+    encoding = choose_encoding(request.headers.get("accept-encoding"))
+    if encoding is not None and len(shared.payload) >= settings.COMPRESSION_MIN_SIZE:
+        # Vary: Accept-Encoding과 weak ETag는 CompressionMiddleware가 모든 응답에 적용
+        headers["Content-Encoding"] = encoding
+    else:
+        encoding = None
+
+    return Response(
+        content=shared.render(overlay, encoding),
+        media_type="application/json",
+        headers=headers
+    )
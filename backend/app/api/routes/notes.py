@@ -8,6 +8,7 @@ from app.api.deps import get_current_user
 from app.models.user import User
 from app.models.note import UserNote
 from app.models.topic import Topic
+from app.services.study_events import NOTE, record_event
 from app.schemas.note import NoteCreate, NoteUpdate, NoteResponse
 
 router = APIRouter(prefix="/api/notes", tags=["notes"])
@@ -37,7 +38,7 @@ async def create_note(
 ):
     """포스트잇 메모 생성"""
     # 토픽 존재 확인
-    topic = db.query(Topic).filter(Topic.id == note_data.topic_id).first()
+    topic = db.query(Topic.id).filter(Topic.id == note_data.topic_id).first()
     if not topic:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -58,6 +59,7 @@ async def create_note(
     )
 
     db.add(new_note)
+    record_event(db, current_user.id, note_data.topic_id, NOTE)
     db.commit()
     db.refresh(new_note)
 
@@ -104,8 +106,10 @@ async def update_note(
             detail="Note not found"
         )
 
-    # 업데이트할 필드만 수정
+    # 업데이트할 필드만 수정 (내용이 바뀐 경우만 학습 이벤트로 기록)
     if note_data.content is not None:
+        if note_data.content != note.content:
+            record_event(db, current_user.id, note.topic_id, NOTE)
         note.content = note_data.content
     if note_data.position_x is not None:
         note.position_x = note_data.position_x
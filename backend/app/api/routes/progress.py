@@ -0,0 +1,111 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+from sqlalchemy import func
+from datetime import timedelta
+from typing import List
+
+from app.core.database import get_db
+from app.api.deps import get_current_user
+from app.models.user import User
+from app.models.category import Category
+from app.models.study_event import StudyDailyRollup
+from app.schemas.progress import DailyProgress, CategoryProgress, StudyStreak
+from app.services.study_events import today
+
+router = APIRouter(prefix="/api/progress", tags=["progress"])
+
+# 진도 API는 일별 합계(study_daily_rollups)만 조회 (원본 이벤트는 읽지 않음)
+# 합계는 STUDY_COMPACT_INTERVAL_SECONDS 주기로 갱신되므로 최근 기록은 잠시 늦게 반영될 수 있음
+
+
+@router.get("/daily", response_model=List[DailyProgress])
+async def get_daily_progress(
+    days: int = Query(30, ge=1, le=366),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """최근 N일간 일별 학습량 (기록이 없는 날은 0, 오래된 날부터)"""
+    end = today()
+    start = end - timedelta(days=days - 1)
+
+    rows = db.query(
+        StudyDailyRollup.day,
+        func.sum(StudyDailyRollup.reads).label("reads"),
+        func.sum(StudyDailyRollup.bookmarks).label("bookmarks"),
+        func.sum(StudyDailyRollup.notes).label("notes")
+    ).filter(
+        StudyDailyRollup.user_id == current_user.id,
+        StudyDailyRollup.day >= start
+    ).group_by(StudyDailyRollup.day).all()
+    by_day = {row.day: row for row in rows}
+
+    result = []
+    for offset in range(days):
+        day = start + timedelta(days=offset)
+        row = by_day.get(day)
+        result.append(DailyProgress(
+            day=day,
+            reads=row.reads if row else 0,
+            bookmarks=row.bookmarks if row else 0,
+            notes=row.notes if row else 0
+        ))
+    return result
+
+
+@router.get("/categories", response_model=List[CategoryProgress])
+async def get_category_progress(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """카테고리별 누적 학습량 (회독 많은 순)"""
+    totals = db.query(
+        StudyDailyRollup.category_id,
+        func.sum(StudyDailyRollup.reads).label("reads"),
+        func.sum(StudyDailyRollup.bookmarks).label("bookmarks"),
+        func.sum(StudyDailyRollup.notes).label("notes"),
+        func.max(StudyDailyRollup.day).label("last_studied_on")
+    ).filter(
+        StudyDailyRollup.user_id == current_user.id
+    ).group_by(StudyDailyRollup.category_id).subquery()
+
+    rows = db.query(totals, Category.name.label("category_name")).outerjoin(
+        Category, Category.id == totals.c.category_id
+    ).order_by(totals.c.reads.desc(), totals.c.category_id).all()
+
+    return [
+        CategoryProgress(
+            category_id=row.category_id or None,
+            category_name=row.category_name,
+            reads=row.reads,
+            bookmarks=row.bookmarks,
+            notes=row.notes,
+            last_studied_on=row.last_studied_on
+        )
+        for row in rows
+    ]
+
+
+@router.get("/streak", response_model=StudyStreak)
+async def get_study_streak(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """연속 학습일 (회독 또는 메모 작성이 있는 날 기준)"""
+    days = [
+        row.day for row in db.query(StudyDailyRollup.day).filter(
+            StudyDailyRollup.user_id == current_user.id
+        ).group_by(StudyDailyRollup.day).having(
+            func.sum(StudyDailyRollup.reads) + func.sum(StudyDailyRollup.notes) > 0
+        ).order_by(StudyDailyRollup.day)
+    ]
+    if not days:
+        return StudyStreak(current=0, longest=0, last_studied_on=None)
+
+    longest = run = 1
+    for previous, day in zip(days, days[1:]):
+        run = run + 1 if day - previous == timedelta(days=1) else 1
+        longest = max(longest, run)
+
+    # 마지막 연속 구간이 오늘 또는 어제까지 이어져 있어야 현재 진행 중인 기록
+    current = run if today() - days[-1] <= timedelta(days=1) else 0
+    return StudyStreak(current=current, longest=longest, last_studied_on=days[-1])
@@ -1,14 +1,21 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
-from sqlalchemy import func
-from typing import List
+from sqlalchemy import Integer, TIMESTAMP, cast, column, func, literal, select, values
+from sqlalchemy.dialects.postgresql import insert as pg_insert, UUID as PG_UUID
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
 
 from app.core.database import get_db
 from app.api.deps import get_current_user
 from app.models.user import User
 from app.models.read_count import UserReadCount
 from app.models.topic import Topic
-from app.schemas.read_count import ReadCountIncrement, ReadCountResponse
+from app.services.study_events import READ, record_event, record_events
+from app.services import review_queue
+from app.schemas.read_count import (
+    ReadCountIncrement, ReadCountResponse, ReadCountBatch, ReadCountBatchResult
+)
 
 router = APIRouter(prefix="/api/read-counts", tags=["read-counts"])
 
@@ -26,44 +33,111 @@ async def get_my_read_counts(
     return read_counts
 
 
+def upsert_read_counts(source):
+    """
+    회독 카운트 upsert 문 (source: topic_id, count, last_read_at 행을 내는 SELECT)
+
+    이미 있으면 count를 더하고 last_read_at은 더 최근 값으로, 결과 행을 RETURNING
+    """
+    statement = pg_insert(UserReadCount.__table__).from_select(
+        ["user_id", "topic_id", "count", "last_read_at"],
+        source
+    )
+    return statement.on_conflict_do_update(
+        index_elements=[UserReadCount.user_id, UserReadCount.topic_id],
+        set_={
+            "count": func.coalesce(UserReadCount.count, 0) + statement.excluded.count,
+            "last_read_at": func.greatest(UserReadCount.last_read_at, statement.excluded.last_read_at),
+        }
+    ).returning(*UserReadCount.__table__.c)
+
+
 @router.post("", response_model=ReadCountResponse)
 async def increment_read_count(
     read_count_data: ReadCountIncrement,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """회독 카운트 증가"""
-    # 토픽 존재 확인
-    topic = db.query(Topic).filter(Topic.id == read_count_data.topic_id).first()
-    if not topic:
+    """
+    회독 카운트 증가
+
+    토픽 존재 확인 + 추가/증가를 INSERT ... SELECT ... ON CONFLICT DO UPDATE 한 문장으로 처리
+    (연속 요청이 겹쳐도 기본 키 충돌 없이 누적)
+    """
+    source = select(
+        literal(current_user.id, PG_UUID(as_uuid=True)),
+        Topic.id,
+        literal(1),
+        func.current_timestamp()
+    ).where(Topic.id == read_count_data.topic_id)
+
+    read_count = db.execute(upsert_read_counts(source)).first()
+    if read_count is None:
+        db.rollback()
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Topic not found"
         )
 
-    # 기존 회독 카운트 확인
-    read_count = db.query(UserReadCount).filter(
-        UserReadCount.user_id == current_user.id,
-        UserReadCount.topic_id == read_count_data.topic_id
-    ).first()
+    record_event(db, current_user.id, read_count_data.topic_id, READ)
+    db.commit()
+    review_queue.record_read(current_user.id, read_count.topic_id, read_count.count, read_count.last_read_at)
+    return ReadCountResponse.model_validate(read_count)
 
-    if read_count:
-        # 카운트 증가
-        read_count.count += 1
-        read_count.last_read_at = func.current_timestamp()
-    else:
-        # 새로운 회독 카운트 생성
-        read_count = UserReadCount(
-            user_id=current_user.id,
-            topic_id=read_count_data.topic_id,
-            count=1
-        )
-        db.add(read_count)
 
+@router.post("/batch", response_model=ReadCountBatchResult)
+async def increment_read_counts_batch(
+    batch: ReadCountBatch,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    회독 기록 일괄 반영 (오프라인 PWA가 재연결 시 한 번에 전송)
+
+    토픽별로 합산한 뒤 한 번의 upsert로 반영, 존재하지 않는 토픽은 무시
+    read_at은 미래 시각이면 서버 시각으로 제한
+    """
+    totals: Dict[int, int] = defaultdict(int)
+    latest: Dict[int, Optional[datetime]] = {}
+    study_events = []
+    for event in batch.events:
+        totals[event.topic_id] += event.delta
+        read_at = event.read_at
+        if read_at is not None and read_at.tzinfo is not None:
+            # DB의 TIMESTAMP 컬럼은 timezone 정보 없이 UTC로 저장
+            read_at = read_at.astimezone(timezone.utc).replace(tzinfo=None)
+        study_events.append((event.topic_id, event.delta, read_at))
+        previous = latest.get(event.topic_id)
+        latest[event.topic_id] = read_at if previous is None or (read_at is not None and read_at > previous) else previous
+
+    events = values(
+        column("topic_id", Integer),
+        column("delta", Integer),
+        column("read_at", TIMESTAMP),
+        name="events"
+    ).data([(topic_id, total, latest[topic_id]) for topic_id, total in totals.items()])
+
+    now = func.current_timestamp()
+    source = select(
+        literal(current_user.id, PG_UUID(as_uuid=True)),
+        Topic.id,
+        events.c.delta,
+        # read_at이 모두 NULL이면 VALUES 열이 text로 추론되므로 명시적으로 캐스팅
+        func.least(func.coalesce(cast(events.c.read_at, TIMESTAMP), now), now)
+    ).select_from(events).join(Topic, Topic.id == events.c.topic_id)
+
+    rows = db.execute(upsert_read_counts(source)).all()
+    # 일별 진도용 이벤트는 합산 전 원래 시각 그대로 기록
+    record_events(db, current_user.id, READ, study_events)
     db.commit()
-    db.refresh(read_count)
+    for row in rows:
+        review_queue.record_read(current_user.id, row.topic_id, row.count, row.last_read_at)
 
-    return read_count
+    applied = {row.topic_id for row in rows}
+    return ReadCountBatchResult(
+        read_counts=[ReadCountResponse.model_validate(row) for row in rows],
+        skipped_topic_ids=sorted(topic_id for topic_id in totals if topic_id not in applied)
+    )
 
 
 @router.get("/{topic_id}", response_model=ReadCountResponse)
@@ -80,7 +154,6 @@ async def get_read_count(
 
     if not read_count:
         # 회독 기록이 없으면 0으로 반환
-        from datetime import datetime
         return ReadCountResponse(
             user_id=current_user.id,
             topic_id=topic_id,
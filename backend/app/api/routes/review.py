@@ -0,0 +1,45 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+from datetime import datetime, timezone
+from typing import List
+
+from app.core.database import get_db
+from app.core.version_stamp import TOPICS, get_version
+from app.api.deps import get_current_user
+from app.models.user import User
+from app.schemas.review import ReviewItem
+from app.services.review_queue import get_review_queue
+
+router = APIRouter(prefix="/api/review", tags=["review"])
+
+
+@router.get("/next", response_model=List[ReviewItem])
+async def get_next_reviews(
+    n: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    다음에 복습할 토픽 N개 (복습 예정 시각이 이른 순, 같으면 중요도 높은 순)
+
+    사용자별 힙을 메모리에 유지하므로 전체 토픽을 다시 계산하지 않고 앞쪽 N개만 꺼냄
+    """
+    version, _ = get_version(db, TOPICS)
+    queue = get_review_queue(db, current_user.id, version)
+
+    now = datetime.now(timezone.utc).timestamp()
+    items = []
+    for topic, state in queue.peek(n):
+        # DB의 TIMESTAMP 컬럼과 같이 timezone 정보 없는 UTC로 응답
+        due_at = datetime.utcfromtimestamp(state.due) if state.count else None
+        items.append(ReviewItem(
+            topic_id=topic.id,
+            title=topic.title,
+            category_id=topic.category_id,
+            importance_level=topic.importance_level,
+            read_count=state.count,
+            last_read_at=state.last_read_at,
+            due_at=due_at,
+            overdue=state.due <= now
+        ))
+    return items
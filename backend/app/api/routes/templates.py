@@ -1,8 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
 from sqlalchemy.orm import Session
 from typing import List, Optional
 
 from app.core.database import get_db
+from app.core.http_cache import make_etag, cache_headers, is_not_modified, not_modified_response
+from app.core.version_stamp import TEMPLATES, bump_version, get_version
 from app.models.template import Template
 from app.models.user import User
 from app.schemas.template import TemplateCreate, TemplateUpdate, TemplateResponse, TemplateListItem
@@ -13,12 +15,20 @@ router = APIRouter()
 
 @router.get("/", response_model=List[TemplateListItem])
 async def get_templates(
+    request: Request,
+    response: Response,
     category: Optional[str] = Query(None),
     db: Session = Depends(get_db)
 ):
     """
-    템플릿 목록 조회
+    템플릿 목록 조회 (변경이 없으면 304)
     """
+    version, updated_at = get_version(db, TEMPLATES)
+    headers = cache_headers(make_etag("templates", version, category), updated_at)
+    if is_not_modified(request, headers["ETag"], updated_at):
+        return not_modified_response(headers)
+
+    response.headers.update(headers)
     query = db.query(Template)
 
     if category is not None:
@@ -29,10 +39,21 @@ async def get_templates(
 
 
 @router.get("/{template_id}", response_model=TemplateResponse)
-async def get_template(template_id: int, db: Session = Depends(get_db)):
+async def get_template(
+    template_id: int,
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db)
+):
     """
-    특정 템플릿 조회
+    특정 템플릿 조회 (변경이 없으면 304)
     """
+    version, updated_at = get_version(db, TEMPLATES)
+    headers = cache_headers(make_etag("template", template_id, version), updated_at)
+    if is_not_modified(request, headers["ETag"], updated_at):
+        return not_modified_response(headers)
+
+    response.headers.update(headers)
     template = db.query(Template).filter(Template.id == template_id).first()
     if not template:
         raise HTTPException(status_code=404, detail="Template not found")
@@ -53,6 +74,7 @@ async def create_template(
         created_by=current_user.id
     )
     db.add(template)
+    bump_version(db, TEMPLATES)
     db.commit()
     db.refresh(template)
     return template
@@ -77,6 +99,7 @@ async def update_template(
     for field, value in update_data.items():
         setattr(template, field, value)
 
+    bump_version(db, TEMPLATES)
     db.commit()
     db.refresh(template)
     return template
@@ -96,4 +119,5 @@ async def delete_template(
         raise HTTPException(status_code=404, detail="Template not found")
 
     db.delete(template)
+    bump_version(db, TEMPLATES)
     db.commit()
@@ -0,0 +1,123 @@
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy.orm import Session
+from typing import List
+
+from app.core.database import get_db
+from app.core.version_stamp import TOPICS, bump_version
+from app.api.deps import require_admin
+from app.models.user import User
+from app.models.topic import Topic
+from app.models.topic_version import TopicVersion
+from app.schemas.topic import TopicResponse
+from app.schemas.topic_version import TopicVersionListItem, TopicVersionResponse, TopicVersionDiff
+from app.services import topic_cache
+from app.services.topic_search import search_vector_expression
+from app.services.topic_versions import TopicState, reconstruct, record_version, diff_versions
+
+router = APIRouter(prefix="/api/topics/{topic_id}/versions", tags=["topic-versions"])
+
+
+def get_version_or_404(db: Session, topic_id: int, version: int):
+    reconstructed = reconstruct(db, topic_id, version)
+    if reconstructed is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Version not found"
+        )
+    return reconstructed
+
+
+@router.get("", response_model=List[TopicVersionListItem])
+async def get_topic_versions(
+    topic_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_admin)
+):
+    """서브노트 수정 이력 목록 (관리자만, 최신순)"""
+    return db.query(
+        TopicVersion.version,
+        TopicVersion.title,
+        TopicVersion.is_snapshot,
+        TopicVersion.content_length,
+        TopicVersion.created_by,
+        TopicVersion.created_at
+    ).filter(
+        TopicVersion.topic_id == topic_id
+    ).order_by(TopicVersion.version.desc()).all()
+
+
+@router.get("/diff", response_model=TopicVersionDiff)
+async def diff_topic_versions(
+    topic_id: int,
+    from_version: int = Query(..., ge=1),
+    to_version: int = Query(..., ge=1),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_admin)
+):
+    """두 버전 간 비교 (관리자만)"""
+    old = get_version_or_404(db, topic_id, from_version)
+    new = get_version_or_404(db, topic_id, to_version)
+
+    return TopicVersionDiff(
+        topic_id=topic_id,
+        from_version=from_version,
+        to_version=to_version,
+        diff=diff_versions(old, new, f"v{from_version}", f"v{to_version}")
+    )
+
+
+@router.get("/{version}", response_model=TopicVersionResponse)
+async def get_topic_version(
+    topic_id: int,
+    version: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_admin)
+):
+    """특정 버전 미리보기 (관리자만)"""
+    reconstructed = get_version_or_404(db, topic_id, version)
+
+    return TopicVersionResponse(
+        topic_id=topic_id,
+        version=reconstructed.version,
+        title=reconstructed.title,
+        keywords=reconstructed.keywords,
+        mnemonic=reconstructed.mnemonic,
+        content=reconstructed.content,
+        created_by=reconstructed.created_by,
+        created_at=reconstructed.created_at
+    )
+
+
+@router.post("/{version}/restore", response_model=TopicResponse)
+async def restore_topic_version(
+    topic_id: int,
+    version: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_admin)
+):
+    """이전 버전으로 복구 (관리자만, 복구 결과도 새 버전으로 기록)"""
+    # 동시 수정 시 수정 전 상태(버전 이력의 delta 기준)가 어긋나지 않도록 행을 잠금
+    topic = db.query(Topic).filter(Topic.id == topic_id).with_for_update().first()
+    if not topic:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Topic not found"
+        )
+
+    reconstructed = get_version_or_404(db, topic_id, version)
+    previous = TopicState.of(topic)
+
+    topic.title = reconstructed.title
+    topic.keywords = reconstructed.keywords
+    topic.mnemonic = reconstructed.mnemonic
+    topic.content = reconstructed.content
+    topic.search_vector = search_vector_expression(
+        topic.title, topic.keywords, topic.mnemonic, topic.content
+    )
+    record_version(db, topic, current_user.id, previous=previous)
+    bump_version(db, TOPICS)
+
+    db.commit()
+    topic_cache.invalidate(topic_id)
+    db.refresh(topic)
+    return topic
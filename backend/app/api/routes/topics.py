@@ -1,34 +1,144 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import any_, literal
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.types import Integer
 from typing import List, Optional
-
-from app.core.database import get_db
+import json
+
+from app.core.database import get_db, SessionLocal
+from app.core.compression import choose_encoding
+from app.core.http_cache import make_etag, cache_headers, is_not_modified, not_modified_response
+from app.core.pagination import (
+    NEXT_CURSOR_HEADER, encode_cursor, decode_cursor, cursor_int, cursor_datetime, nullable, keyset_order, keyset_filter
+)
+from app.core.version_stamp import TOPICS, bump_version
+from app.core.view_counter import view_counter
 from app.models.topic import Topic
 from app.models.user import User
-from app.schemas.topic import TopicCreate, TopicUpdate, TopicResponse, TopicListItem
+from app.schemas.topic import (
+    TopicCreate, TopicUpdate, TopicResponse, TopicListItem, TopicSearchResult, CategoryInfo, TopicImportResult
+)
+from app.services import topic_cache, category_tree
+from app.services.topic_import import TopicImporter
+from app.services.topic_versions import TopicState, record_version
+from app.services.topic_summary import topic_summary_query, dump_list_items, dump_list_item
+from app.services.topic_search import build_tsquery, tsquery_expression, search_vector_expression, build_snippet
 from app.api.deps import require_admin, get_current_user
 
 router = APIRouter()
 
+# 목록 정렬 키: (order_index, created_at DESC, id) - idx_topics_list_order 인덱스와 일치
+TOPIC_LIST_KEYS = ((Topic.order_index, False), (Topic.created_at, True), (Topic.id, False))
+TOPIC_LIST_ORDER = tuple(keyset_order(TOPIC_LIST_KEYS))
+
+STREAM_BATCH_SIZE = 500
+
+
+def topic_list_cursor(row) -> str:
+    return encode_cursor(row.order_index, row.created_at, row.id)
+
+
+def topic_list_seek_filter(cursor: str):
+    """커서 위치 이후의 행만 조회하는 keyset 조건 (order_index/created_at이 NULL인 행 포함)"""
+    values = decode_cursor(cursor, nullable(cursor_int), nullable(cursor_datetime), cursor_int)
+    return keyset_filter(TOPIC_LIST_KEYS, values)
+
 
 @router.get("/", response_model=List[TopicListItem])
 async def get_topics(
     category_id: Optional[int] = Query(None),
+    include_descendants: bool = Query(False),
     is_published: Optional[bool] = Query(None),
     search: Optional[str] = Query(None),
+    cursor: Optional[str] = Query(None),
     skip: int = Query(0, ge=0),
-    limit: int = Query(100, ge=1, le=100),
+    limit: int = Query(100, ge=1, le=500),
     db: Session = Depends(get_db)
 ):
     """
     서브노트 목록 조회 (필터링 및 검색 지원)
 
-    - search: 제목 또는 키워드로 검색
+    - include_descendants: category_id의 하위 카테고리 토픽까지 포함 (트리 순서 -> order_index 순 정렬)
+    - search: 제목/키워드/암기두음법/본문 전문 검색 (검색 시 관련도 순 정렬)
+    - cursor: 이전 응답의 X-Next-Cursor 헤더 값 (keyset 페이지네이션, skip 무시)
     """
-    from app.models.comment import Comment
     from sqlalchemy import func as sql_func
 
-    query = db.query(Topic)
+    # 요약 컬럼만 projection (본문 제외), 카테고리는 JOIN, 댓글 수는 비정규화 컬럼 사용
+    query = topic_summary_query(db)
+    order_by = list(TOPIC_LIST_ORDER)
+    include_descendants = include_descendants and category_id is not None
+
+    if include_descendants:
+        # 캐시된 카테고리 트리에서 하위 트리 id를 트리 표시 순서로 얻어 한 번의 쿼리로 조회
+        category_ids = category_tree.get_category_tree(db).subtree_ids(category_id)
+        if not category_ids:
+            return []
+        query = query.filter(Topic.category_id == any_(literal(category_ids, ARRAY(Integer))))
+        order_by.insert(0, sql_func.array_position(literal(category_ids, ARRAY(Integer)), Topic.category_id))
+    elif category_id is not None:
+        query = query.filter(Topic.category_id == category_id)
+
+    if is_published is not None:
+        query = query.filter(Topic.is_published == is_published)
+
+    if cursor is not None:
+        if search:
+            raise HTTPException(status_code=400, detail="cursor cannot be combined with search")
+        if include_descendants:
+            raise HTTPException(status_code=400, detail="cursor cannot be combined with include_descendants")
+        query = query.filter(topic_list_seek_filter(cursor))
+        skip = 0
+
+    # 전문 검색 (GIN 인덱스 사용)
+    if search:
+        tsquery = build_tsquery(search)
+        if tsquery is None:
+            return []
+        ts_query = tsquery_expression(tsquery)
+        query = query.filter(Topic.search_vector.bool_op("@@")(ts_query))
+        order_by.insert(0, sql_func.ts_rank(Topic.search_vector, ts_query).desc())
+
+    rows = query.order_by(*order_by).offset(skip).limit(limit).all()
+
+    # 페이지가 가득 찼다면 다음 페이지 커서 제공 (검색/하위 트리 조회는 정렬 키가 달라 제외)
+    headers = {}
+    if not search and not include_descendants and len(rows) == limit:
+        headers[NEXT_CURSOR_HEADER] = topic_list_cursor(rows[-1])
+
+    return Response(content=dump_list_items(rows), media_type="application/json", headers=headers)
+
+
+@router.get("/search", response_model=List[TopicSearchResult])
+async def search_topics(
+    q: str = Query(..., min_length=1, max_length=200),
+    category_id: Optional[int] = Query(None),
+    is_published: Optional[bool] = Query(None),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=50),
+    db: Session = Depends(get_db)
+):
+    """
+    서브노트 전문 검색 (관련도 순, 강조된 스니펫 포함)
+
+    - 제목 > 키워드 > 암기두음법 > 본문 순으로 가중치 적용
+    - 한글은 bi-gram 단위로 색인되어 부분 일치 검색 가능
+    - 본문은 스니펫 생성용으로 결과 페이지(최대 limit개)에서만 읽음
+    """
+    from sqlalchemy import func as sql_func
+
+    tsquery = build_tsquery(q)
+    if tsquery is None:
+        return []
+
+    ts_query = tsquery_expression(tsquery)
+    rank = sql_func.ts_rank(Topic.search_vector, ts_query).label("rank")
+
+    query = topic_summary_query(db, Topic.content, rank).filter(
+        Topic.search_vector.bool_op("@@")(ts_query)
+    )
 
     if category_id is not None:
         query = query.filter(Topic.category_id == category_id)
@@ -36,56 +146,204 @@ async def get_topics(
     if is_published is not None:
         query = query.filter(Topic.is_published == is_published)
 
-    # 검색 (제목 또는 키워드)
-    if search:
-        search_filter = f"%{search}%"
-        query = query.filter(
-            (Topic.title.ilike(search_filter)) |
-            (Topic.keywords.ilike(search_filter))
+    rows = query.order_by(rank.desc(), Topic.id).offset(skip).limit(limit).all()
+
+    return [
+        TopicSearchResult(
+            id=row.id,
+            title=row.title,
+            category_id=row.category_id,
+            category=CategoryInfo(id=row.category_id, name=row.category_name) if row.category_name else None,
+            is_published=row.is_published,
+            importance_level=row.importance_level,
+            keywords=row.keywords,
+            rank=row.rank,
+            snippet=build_snippet(q, row.content, row.mnemonic, row.keywords, row.title),
         )
+        for row in rows
+    ]
 
-    topics = query.order_by(Topic.order_index, Topic.created_at.desc()).offset(skip).limit(limit).all()
 
-    # 댓글 수 추가
-    result = []
-    for topic in topics:
-        comments_count = db.query(sql_func.count(Comment.id)).filter(
-            Comment.topic_id == topic.id
-        ).scalar()
+@router.get("/stream")
+async def stream_published_topics(category_id: Optional[int] = Query(None)):
+    """
+    공개된 서브노트 전체 목록 스트리밍 (NDJSON, 한 줄에 TopicListItem 하나)
 
-        topic_dict = {
-            "id": topic.id,
-            "title": topic.title,
-            "category_id": topic.category_id,
-            "category": topic.category,
-            "is_published": topic.is_published,
-            "view_count": topic.view_count,
-            "importance_level": topic.importance_level,
-            "keywords": topic.keywords,
-            "mnemonic": topic.mnemonic,
-            "comments_count": comments_count or 0,
-            "created_at": topic.created_at,
-            "updated_at": topic.updated_at,
-        }
-        result.append(topic_dict)
-
-    return result
+    서버 측 커서로 일정 개수씩 읽어 전송하므로 전체 카탈로그를 한 번의 요청으로 받을 수 있음
+    """
+    def generate():
+        # 응답 스트리밍 중에도 유지되어야 하므로 요청 의존성과 별도의 세션 사용
+        db = SessionLocal()
+        try:
+            query = topic_summary_query(db).filter(Topic.is_published.is_(True))
+            if category_id is not None:
+                query = query.filter(Topic.category_id == category_id)
+
+            for row in query.order_by(*TOPIC_LIST_ORDER).yield_per(STREAM_BATCH_SIZE):
+                yield dump_list_item(row) + b"\n"
+        finally:
+            db.close()
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+
+@router.get("/export")
+async def export_topics(
+    category_id: Optional[int] = Query(None),
+    current_user: User = Depends(require_admin)
+):
+    """
+    서브노트 내보내기 (관리자만, NDJSON)
+
+    한 줄에 토픽 하나이며 /import 형식과 호환됨
+    서버 측 커서로 일정 개수씩 읽어 전송하므로 메모리 사용량이 전체 개수와 무관
+    """
+    def generate():
+        # 응답 스트리밍 중에도 유지되어야 하므로 요청 의존성과 별도의 세션 사용
+        db = SessionLocal()
+        try:
+            query = db.query(
+                Topic.id,
+                Topic.title,
+                Topic.content,
+                Topic.keywords,
+                Topic.mnemonic,
+                Topic.category_id,
+                Topic.is_published,
+                Topic.importance_level,
+                Topic.order_index,
+            )
+            if category_id is not None:
+                query = query.filter(Topic.category_id == category_id)
+
+            for row in query.order_by(Topic.id).yield_per(STREAM_BATCH_SIZE):
+                yield json.dumps(row._asdict(), ensure_ascii=False) + "\n"
+        finally:
+            db.close()
+
+    return StreamingResponse(
+        generate(),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": 'attachment; filename="topics.ndjson"'}
+    )
+
+
+@router.post("/import", response_model=TopicImportResult)
+async def import_topics(
+    request: Request,
+    atomic: bool = Query(False),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_admin)
+):
+    """
+    서브노트 일괄 가져오기 (관리자만)
+
+    - 본문: NDJSON (application/x-ndjson) 또는 multipart 파일 (필드명 file)
+    - 한 줄에 TopicCreate 형식의 JSON 하나
+    - 배치 단위 INSERT, 전체를 하나의 트랜잭션으로 커밋
+    - atomic=true: 한 줄이라도 실패하면 아무것도 저장하지 않음
+    """
+    importer = TopicImporter(db, created_by=current_user.id)
+
+    content_type = request.headers.get("content-type", "")
+    if content_type.startswith("multipart/form-data"):
+        form = await request.form()
+        upload = form.get("file")
+        if upload is None or isinstance(upload, str):
+            raise HTTPException(status_code=400, detail="Multipart field 'file' is required")
+        for line_number, line in enumerate(upload.file, start=1):
+            importer.add_line(line_number, line)
+    else:
+        line_number = 0
+        buffer = b""
+        async for chunk in request.stream():
+            buffer += chunk
+            *lines, buffer = buffer.split(b"\n")
+            for line in lines:
+                line_number += 1
+                importer.add_line(line_number, line)
+        if buffer:
+            importer.add_line(line_number + 1, buffer)
+
+    importer.flush()
+
+    if atomic and importer.errors:
+        db.rollback()
+        return TopicImportResult(imported=0, failed=len(importer.errors), errors=importer.errors)
+
+    if importer.imported:
+        bump_version(db, TOPICS)
+    db.commit()
+    return TopicImportResult(
+        imported=importer.imported,
+        failed=len(importer.errors),
+        errors=importer.errors
+    )
+
+
+@router.get("/cache/stats")
+async def get_topic_cache_stats(current_user: User = Depends(require_admin)):
+    """
+    토픽 상세 캐시 통계 (관리자만)
+    """
+    return topic_cache.topic_cache.stats()
 
 
 @router.get("/{topic_id}", response_model=TopicResponse)
-async def get_topic(topic_id: int, db: Session = Depends(get_db)):
+async def get_topic(topic_id: int, request: Request, db: Session = Depends(get_db)):
     """
     특정 서브노트 조회
+
+    - ETag / Last-Modified를 제공하며, 변경이 없으면 본문을 읽지 않고 304 반환
+      (조회수는 ETag에 포함하지 않음)
+    - 직렬화된 본문은 (updated_at, 카테고리 이름) 버전별로 메모리에 캐시
+    - Accept-Encoding에 따라 미리 압축해 둔 본문(br/gzip)으로 응답
     """
-    topic = db.query(Topic).filter(Topic.id == topic_id).first()
-    if not topic:
-        raise HTTPException(status_code=404, detail="Topic not found")
+    from app.models.category import Category
 
-    # 조회수 증가
-    topic.view_count += 1
-    db.commit()
+    # 본문 없이 버전 정보만 조회
+    version = db.query(Topic.updated_at, Topic.view_count, Category.name).outerjoin(
+        Category, Category.id == Topic.category_id
+    ).filter(Topic.id == topic_id).first()
+    if not version:
+        raise HTTPException(status_code=404, detail="Topic not found")
 
-    return topic
+    # 조회수 증가 (메모리에 누적 후 주기적으로 일괄 반영)
+    view_counter.record(topic_id)
+
+    etag = make_etag("topic", topic_id, version.updated_at, version.name)
+    headers = cache_headers(etag, version.updated_at)
+    if is_not_modified(request, etag, version.updated_at):
+        return not_modified_response(headers)
+
+    view_count = version.view_count or 0
+    cached = topic_cache.get_cached(topic_id, (version.updated_at, version.name))
+    if cached is None:
+        topic = db.query(Topic).options(joinedload(Topic.category)).filter(Topic.id == topic_id).first()
+        if not topic:
+            raise HTTPException(status_code=404, detail="Topic not found")
+
+        cached = topic_cache.store(topic)
+        view_count = topic.view_count or 0
+        # 버전 조회 이후 변경되었을 수 있으므로 실제로 읽은 행 기준으로 헤더 생성
+        updated_at, category_name = cached.version
+        headers = cache_headers(make_etag("topic", topic_id, updated_at, category_name), updated_at)
+
+    view_count += view_counter.pending(topic_id)
+
+    # 압축본은 버전마다 한 번만 만들고 요청마다 조회수 부분만 덧붙임
+    encoding = choose_encoding(request.headers.get("accept-encoding"))
+    if cached.is_compressed(encoding):
+        # Vary: Accept-Encoding과 weak ETag는 CompressionMiddleware가 모든 응답에 적용
+        headers["Content-Encoding"] = encoding
+    else:
+        encoding = None
+
+    return Response(
+        content=cached.render(view_count, encoding),
+        media_type="application/json",
+        headers=headers
+    )
 
 
 @router.post("/", response_model=TopicResponse, status_code=status.HTTP_201_CREATED)
@@ -97,6 +355,8 @@ async def create_topic(
     """
     새 서브노트 생성 (관리자만)
     """
+    from sqlalchemy import func as sql_func
+
     # category_id가 있다면 존재하는지 확인
     if topic_data.category_id:
         from app.models.category import Category
@@ -106,16 +366,22 @@ async def create_topic(
 
     # order_index가 지정되지 않았다면 마지막으로 설정
     if topic_data.order_index == 0:
-        max_order = db.query(Topic).filter(
+        max_order = db.query(sql_func.count(Topic.id)).filter(
             Topic.category_id == topic_data.category_id
-        ).count()
+        ).scalar()
         topic_data.order_index = max_order
 
     topic = Topic(
         **topic_data.model_dump(),
-        created_by=current_user.id
+        created_by=current_user.id,
+        search_vector=search_vector_expression(
+            topic_data.title, topic_data.keywords, topic_data.mnemonic, topic_data.content
+        )
     )
     db.add(topic)
+    db.flush()
+    record_version(db, topic, current_user.id)
+    bump_version(db, TOPICS)
     db.commit()
     db.refresh(topic)
     return topic
@@ -131,7 +397,8 @@ async def update_topic(
     """
     서브노트 수정 (관리자만)
     """
-    topic = db.query(Topic).filter(Topic.id == topic_id).first()
+    # 동시 수정 시 수정 전 상태(버전 이력의 delta 기준)가 어긋나지 않도록 행을 잠금
+    topic = db.query(Topic).filter(Topic.id == topic_id).with_for_update().first()
     if not topic:
         raise HTTPException(status_code=404, detail="Topic not found")
 
@@ -143,11 +410,21 @@ async def update_topic(
             raise HTTPException(status_code=404, detail="Category not found")
 
     # 업데이트
+    previous = TopicState.of(topic)
     update_data = topic_data.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(topic, field, value)
 
+    # 버전 대상 필드가 바뀌었다면 검색 색인 갱신 및 수정 이력 기록
+    if TopicState.of(topic) != previous:
+        topic.search_vector = search_vector_expression(
+            topic.title, topic.keywords, topic.mnemonic, topic.content
+        )
+        record_version(db, topic, current_user.id, previous=previous)
+
+    bump_version(db, TOPICS)
     db.commit()
+    topic_cache.invalidate(topic_id)
     db.refresh(topic)
     return topic
 
@@ -161,12 +438,15 @@ async def delete_topic(
     """
     서브노트 삭제 (관리자만)
     """
-    topic = db.query(Topic).filter(Topic.id == topic_id).first()
+    # 본문을 읽지 않도록 존재 여부만 확인 후 삭제 (댓글/북마크 등은 DB CASCADE)
+    topic = db.query(Topic.id).filter(Topic.id == topic_id).first()
     if not topic:
         raise HTTPException(status_code=404, detail="Topic not found")
 
-    db.delete(topic)
+    db.query(Topic).filter(Topic.id == topic_id).delete(synchronize_session=False)
+    bump_version(db, TOPICS)
     db.commit()
+    topic_cache.invalidate(topic_id)
 
 
 @router.post("/{topic_id}/publish", response_model=TopicResponse)
@@ -183,6 +463,8 @@ async def toggle_publish(
         raise HTTPException(status_code=404, detail="Topic not found")
 
     topic.is_published = not topic.is_published
+    bump_version(db, TOPICS)
     db.commit()
+    topic_cache.invalidate(topic_id)
     db.refresh(topic)
     return topic
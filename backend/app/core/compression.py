@@ -0,0 +1,211 @@
+import struct
+import zlib
+from typing import Optional, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.http_cache import weak_etag
+
+try:
+    import brotli
+except ImportError:  # brotli 미설치 환경에서는 gzip만 사용
+    brotli = None
+
+GZIP = "gzip"
+BROTLI = "br"
+
+# gzip 헤더: ID1 ID2 CM=deflate FLG=0 MTIME=0 XFL=0 OS=unknown
+_GZIP_HEADER = b"\x1f\x8b\x08\x00\x00\x00\x00\x00\x00\xff"
+# brotli 마지막 빈 meta-block (ISLAST=1, ISLASTEMPTY=1)
+_BROTLI_LAST_EMPTY = b"\x03"
+_BROTLI_MAX_UNCOMPRESSED_BLOCK = 1 << 16
+
+
+def supported_encodings() -> Tuple[str, ...]:
+    return (BROTLI, GZIP) if brotli is not None else (GZIP,)
+
+
+def choose_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """
+    Accept-Encoding에서 사용할 인코딩 선택 (br 우선, q=0은 제외)
+    """
+    if not accept_encoding:
+        return None
+
+    accepted = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[name.strip().lower()] = quality
+
+    for encoding in supported_encodings():
+        if accepted.get(encoding, accepted.get("*", 0.0)) > 0:
+            return encoding
+    return None
+
+
+class _StreamCompressor:
+    """gzip / brotli 스트리밍 압축기 공통 인터페이스"""
+
+    def __init__(self, encoding: str):
+        self.encoding = encoding
+        if encoding == BROTLI:
+            self._compressor = brotli.Compressor(quality=settings.BROTLI_QUALITY)
+        else:
+            self._compressor = zlib.compressobj(settings.GZIP_LEVEL, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        if self.encoding == BROTLI:
+            output = self._compressor.process(data)
+            return output + (self._compressor.finish() if final else self._compressor.flush())
+
+        output = self._compressor.compress(data)
+        return output + self._compressor.flush(zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH)
+
+
+def compress(data: bytes, encoding: str) -> bytes:
+    return _StreamCompressor(encoding).compress(data, final=True)
+
+
+class SplicedBody:
+    """
+    앞부분을 한 번만 압축해 두고, 요청마다 달라지는 짧은 뒷부분만 덧붙이는 압축 본문
+
+    - gzip: 앞부분을 Z_FULL_FLUSH로 끝낸 raw deflate 뒤에 뒷부분을 새 deflate 블록으로 이어붙이고
+      CRC32/길이는 누적 계산
+    - brotli: 앞부분을 flush한 스트림 뒤에 비압축 meta-block과 마지막 빈 meta-block을 붙임
+    """
+
+    def __init__(self, data: bytes, encoding: str):
+        self.encoding = encoding
+        self._crc = zlib.crc32(data)
+        self._size = len(data)
+
+        if encoding == BROTLI:
+            compressor = brotli.Compressor(quality=settings.BROTLI_QUALITY)
+            self.prefix = compressor.process(data) + compressor.flush()
+        else:
+            compressor = zlib.compressobj(settings.GZIP_LEVEL, zlib.DEFLATED, -15)
+            self.prefix = _GZIP_HEADER + compressor.compress(data) + compressor.flush(zlib.Z_FULL_FLUSH)
+
+    def render(self, tail: bytes) -> bytes:
+        if self.encoding == BROTLI:
+            return self.prefix + _brotli_uncompressed_blocks(tail) + _BROTLI_LAST_EMPTY
+
+        compressor = zlib.compressobj(settings.GZIP_LEVEL, zlib.DEFLATED, -15)
+        trailer = struct.pack(
+            "<II",
+            zlib.crc32(tail, self._crc) & 0xFFFFFFFF,
+            (self._size + len(tail)) & 0xFFFFFFFF
+        )
+        return self.prefix + compressor.compress(tail) + compressor.flush() + trailer
+
+
+def _brotli_uncompressed_blocks(data: bytes) -> bytes:
+    # meta-block 헤더: ISLAST=0, MNIBBLES=4(0), MLEN-1(16bit), ISUNCOMPRESSED=1 -> 20bit를 3바이트로 패딩
+    output = b""
+    for start in range(0, len(data), _BROTLI_MAX_UNCOMPRESSED_BLOCK):
+        chunk = data[start:start + _BROTLI_MAX_UNCOMPRESSED_BLOCK]
+        header = ((len(chunk) - 1) << 3) | (1 << 19)
+        output += header.to_bytes(3, "little") + chunk
+    return output
+
+
+def _add_vary_accept_encoding(headers: MutableHeaders) -> None:
+    vary = [value.strip().lower() for value in headers.get("vary", "").split(",")]
+    if "accept-encoding" not in vary and "*" not in vary:
+        headers.add_vary_header("Accept-Encoding")
+
+
+class CompressionMiddleware:
+    """
+    Accept-Encoding에 따라 응답을 brotli 또는 gzip으로 압축하는 ASGI 미들웨어
+
+    - minimum_size 미만의 응답, 이미 Content-Encoding이 지정된 응답(미리 압축된 토픽 본문),
+      SSE 스트림은 그대로 전달
+    - 스트리밍 응답은 청크마다 flush하여 지연 없이 전송
+    - 압축 여부와 관계없이 모든 응답에 Vary: Accept-Encoding
+    - 인코딩을 협상한 요청의 응답(200/304, 라우트에서 미리 압축한 본문 포함)은 ETag를 weak으로 바꿔
+      같은 strong ETag가 서로 다른 바이트 표현을 가리키지 않도록 함
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding"))
+        responder = _CompressionResponder(send, encoding, self.minimum_size)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    def __init__(self, send: Send, encoding: Optional[str], minimum_size: int):
+        self._send = send
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self._start_message: Optional[Message] = None
+        self._compressor: Optional[_StreamCompressor] = None
+        self._passthrough = False
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            # 첫 본문 청크를 보고 압축 여부를 결정하므로 헤더 전송을 미룸
+            self._start_message = message
+            return
+
+        if message["type"] != "http.response.body":
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self._passthrough:
+            await self._send(message)
+            return
+
+        if self._compressor is None:
+            headers = MutableHeaders(raw=self._start_message["headers"])
+            _add_vary_accept_encoding(headers)
+            if self.encoding is not None and "etag" in headers:
+                headers["ETag"] = weak_etag(headers["ETag"])
+
+            if (
+                self.encoding is None
+                or "content-encoding" in headers
+                or headers.get("content-type", "").startswith("text/event-stream")
+                or (not more_body and len(body) < self.minimum_size)
+            ):
+                self._passthrough = True
+                await self._send(self._start_message)
+                await self._send(message)
+                return
+
+            self._compressor = _StreamCompressor(self.encoding)
+            headers["Content-Encoding"] = self.encoding
+
+            compressed = self._compressor.compress(body, final=not more_body)
+            if more_body:
+                del headers["Content-Length"]
+            else:
+                headers["Content-Length"] = str(len(compressed))
+
+            await self._send(self._start_message)
+            await self._send({"type": "http.response.body", "body": compressed, "more_body": more_body})
+            return
+
+        compressed = self._compressor.compress(body, final=not more_body)
+        await self._send({"type": "http.response.body", "body": compressed, "more_body": more_body})
@@ -29,6 +29,44 @@ class Settings(BaseSettings):
     APPLE_CLIENT_ID: str = ""
     APPLE_CLIENT_SECRET: str = ""
 
+    # 조회수 write-behind 버퍼
+    VIEW_COUNT_FLUSH_INTERVAL_SECONDS: float = 10.0  # 주기적 반영 간격
+    VIEW_COUNT_FLUSH_SIZE: int = 1000  # 누적 건수가 이 값에 도달하면 즉시 반영
+
+    # 토픽 상세 응답 캐시 (직렬화된 본문 기준 메모리 한도)
+    TOPIC_CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+
+    # 서브노트 버전 이력: N개 버전마다 전체 스냅샷 저장 (복원 시 최대 N-1개 delta 적용)
+    TOPIC_VERSION_SNAPSHOT_INTERVAL: int = 20
+
+    # 응답 압축 (brotli 미설치 시 gzip만 사용)
+    COMPRESSION_MIN_SIZE: int = 1024  # 이 크기 미만의 응답은 압축하지 않음
+    GZIP_LEVEL: int = 6
+    BROTLI_QUALITY: int = 5
+
+    # 학생 앱 홈 번들: 공용 부분(카테고리 트리 + 공개 토픽 요약) 재구성 주기 (조회수 반영용)
+    HOME_BUNDLE_TTL_SECONDS: float = 60.0
+
+    # 토픽 실시간 이벤트 (댓글 SSE): memory = 단일 워커, postgres = LISTEN/NOTIFY로 여러 워커 간 전달
+    EVENTS_BACKEND: str = "memory"
+    EVENTS_RECONNECT_SECONDS: float = 5.0  # LISTEN 연결이 끊겼을 때 재연결 대기
+    SSE_KEEPALIVE_SECONDS: float = 15.0  # 이벤트가 없을 때 연결 유지용 주석 전송 간격
+
+    # 학습 이벤트 로그 -> 일별 합계
+    STUDY_COMPACT_INTERVAL_SECONDS: float = 60.0  # 합산 주기 (진도 API는 최대 이만큼 늦게 반영)
+    STUDY_COMPACT_BATCH_SIZE: int = 5000
+    STUDY_EVENT_RETENTION_DAYS: int = 90  # 합산된 원본 이벤트 보관 기간
+    STUDY_TIMEZONE: str = "Asia/Seoul"  # 일별 합계/연속 학습일 기준 시간대
+
+    # 복습 큐 (사용자별 힙을 메모리에 유지, 회독 기록 시 해당 토픽만 갱신)
+    REVIEW_QUEUE_CACHE_MAX_BYTES: int = 32 * 1024 * 1024
+    REVIEW_QUEUE_TTL_SECONDS: float = 300.0  # 다른 워커에서 기록된 회독 반영을 위한 재구성 주기
+    REVIEW_BASE_INTERVAL_DAYS: float = 1.0  # 1회독 후 첫 복습 간격 (중요도 3 기준, 회독마다 2배)
+
+    # 사용자별 북마크 id 캐시 (토글 시 무효화)
+    BOOKMARK_CACHE_MAX_BYTES: int = 16 * 1024 * 1024
+    BOOKMARK_CACHE_TTL_SECONDS: float = 30.0  # 다른 워커에서 토글된 북마크 반영 주기
+
     # CORS - 문자열로 받아서 나중에 split
     ALLOWED_ORIGINS: str = "http://localhost:5173,http://localhost:5174"
 
@@ -0,0 +1,145 @@
+import asyncio
+import json
+import logging
+import select
+import threading
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from typing import Dict, Optional, Set
+
+from sqlalchemy import create_engine, func
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import NullPool
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Postgres NOTIFY 채널 이름과 payload 한도 (기본 8000 bytes보다 약간 작게)
+NOTIFY_CHANNEL = "topic_events"
+NOTIFY_MAX_BYTES = 7900
+
+
+class TopicEventBroker:
+    """
+    토픽별 실시간 이벤트 pub/sub (SSE 구독자에게 fan-out)
+
+    - memory: 현재 프로세스의 구독자에게만 전달 (워커 1개)
+    - postgres: NOTIFY로 발행하고 각 워커의 LISTEN 스레드가 받아 전달 (워커 여러 개)
+    """
+
+    def __init__(self, backend: str, queue_size: int = 100):
+        self.backend = backend
+        self.queue_size = queue_size
+        self._subscribers: Dict[int, Set[asyncio.Queue]] = defaultdict(set)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stopping = threading.Event()
+        self._thread = None
+        self._listen_engine = None
+
+    @asynccontextmanager
+    async def subscribe(self, topic_id: int):
+        """토픽 이벤트 큐 구독 (블록을 벗어나면 해제)"""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers[topic_id].add(queue)
+        try:
+            yield queue
+        finally:
+            subscribers = self._subscribers.get(topic_id)
+            if subscribers is not None:
+                subscribers.discard(queue)
+                if not subscribers:
+                    del self._subscribers[topic_id]
+
+    def publish(self, db: Session, topic_id: int, event_type: str, data: dict) -> None:
+        """
+        이벤트 발행 (변경 사항을 커밋한 뒤 호출)
+
+        postgres 백엔드는 같은 세션으로 NOTIFY 후 커밋하므로 다른 워커의 구독자에게도 전달됨
+        """
+        message = {"topic_id": topic_id, "type": event_type, "data": data}
+
+        if self.backend != "postgres":
+            self._dispatch(message)
+            return
+
+        payload = json.dumps(message, ensure_ascii=False, separators=(",", ":"), default=str)
+        if len(payload.encode()) > NOTIFY_MAX_BYTES:
+            # 본문이 너무 길면 내용 없이 보내고 클라이언트가 해당 댓글만 다시 조회
+            message["data"] = {key: value for key, value in data.items() if key != "content"}
+            message["data"]["partial"] = True
+            payload = json.dumps(message, ensure_ascii=False, separators=(",", ":"), default=str)
+
+        try:
+            db.execute(func.pg_notify(NOTIFY_CHANNEL, payload).select())
+            db.commit()
+        except Exception:
+            db.rollback()
+            logger.exception("Failed to publish topic event")
+
+    def _dispatch(self, message: dict) -> None:
+        # LISTEN 스레드에서도 호출되므로 이벤트 루프 스레드에서 큐에 넣음
+        if self._loop is not None and self._loop.is_running():
+            self._loop.call_soon_threadsafe(self._fanout, message)
+        else:
+            self._fanout(message)
+
+    def _fanout(self, message: dict) -> None:
+        for queue in list(self._subscribers.get(message["topic_id"], ())):
+            if queue.full():
+                # 느린 구독자는 가장 오래된 이벤트를 버림
+                queue.get_nowait()
+            queue.put_nowait(message)
+
+    def start(self) -> None:
+        """이벤트 루프 안에서 호출 (postgres 백엔드면 LISTEN 스레드 시작)"""
+        self._loop = asyncio.get_running_loop()
+        if self.backend != "postgres" or self._thread is not None:
+            return
+        # LISTEN 연결은 프로세스가 끝날 때까지 유지되므로 요청용 풀과 분리된 별도 엔진(풀 없음)에서 연결
+        self._listen_engine = create_engine(settings.database_url, poolclass=NullPool)
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._listen, name="topic-event-listener", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._stopping.set()
+            self._thread.join()
+            self._thread = None
+        if self._listen_engine is not None:
+            self._listen_engine.dispose()
+            self._listen_engine = None
+        self._loop = None
+
+    def _listen(self) -> None:
+        while not self._stopping.is_set():
+            connection = None
+            try:
+                connection = self._listen_engine.raw_connection()
+                dbapi_connection = connection.driver_connection
+                dbapi_connection.autocommit = True
+                with dbapi_connection.cursor() as cursor:
+                    cursor.execute(f"LISTEN {NOTIFY_CHANNEL}")
+
+                while not self._stopping.is_set():
+                    # 종료 요청을 확인할 수 있도록 1초마다 깨어남
+                    if select.select([dbapi_connection], [], [], 1.0) == ([], [], []):
+                        continue
+                    dbapi_connection.poll()
+                    while dbapi_connection.notifies:
+                        notify = dbapi_connection.notifies.pop(0)
+                        try:
+                            self._dispatch(json.loads(notify.payload))
+                        except ValueError:
+                            logger.warning("Ignoring malformed topic event payload")
+            except Exception:
+                logger.exception("Topic event listener failed; reconnecting")
+                self._stopping.wait(settings.EVENTS_RECONNECT_SECONDS)
+            finally:
+                if connection is not None:
+                    # LISTEN 상태가 남지 않도록 재사용하지 않고 닫음
+                    connection.invalidate()
+
+
+topic_events = TopicEventBroker(backend=settings.EVENTS_BACKEND)
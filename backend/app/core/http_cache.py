@@ -0,0 +1,71 @@
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Dict, Optional
+
+from fastapi import Request, Response, status
+
+
+def make_etag(*parts) -> str:
+    """버전 정보로부터 strong ETag 생성"""
+    digest = hashlib.sha1("|".join(str(part) for part in parts).encode()).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def weak_etag(etag: str) -> str:
+    """
+    strong ETag -> weak ETag
+
+    압축 등 content-coding이 바뀐 표현에 사용 (If-None-Match는 weak 비교이므로 304는 그대로 동작)
+    """
+    return etag if etag.startswith("W/") else f"W/{etag}"
+
+
+def _as_utc(value: datetime) -> datetime:
+    # DB의 TIMESTAMP 컬럼은 timezone 정보가 없으며 UTC로 저장됨
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def cache_headers(etag: str, last_modified: Optional[datetime] = None) -> Dict[str, str]:
+    """
+    조건부 요청용 응답 헤더
+
+    no-cache: 브라우저가 캐시는 하되 매번 If-None-Match로 재검증하도록 함
+    """
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(_as_utc(last_modified), usegmt=True)
+    return headers
+
+
+def is_not_modified(request: Request, etag: str, last_modified: Optional[datetime] = None) -> bool:
+    """
+    If-None-Match / If-Modified-Since 조건 확인
+
+    If-None-Match가 있으면 If-Modified-Since는 무시 (RFC 9110)
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        candidates = [tag.strip() for tag in if_none_match.split(",")]
+        return "*" in candidates or any(
+            tag == etag or tag.removeprefix("W/") == etag for tag in candidates
+        )
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        # HTTP 날짜는 초 단위이므로 마이크로초 제거 후 비교
+        return _as_utc(last_modified).replace(microsecond=0) <= since
+
+    return False
+
+
+def not_modified_response(headers: Dict[str, str]) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
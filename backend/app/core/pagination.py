@@ -0,0 +1,120 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any, Callable, List, Sequence, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy import and_, false, or_, tuple_
+
+# 다음 페이지 커서를 전달하는 응답 헤더 (목록 응답 본문 형식은 그대로 유지)
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+# DB 정수 컬럼과 비교할 수 있는 범위 (BIGINT)
+_MAX_INT = 2 ** 63 - 1
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def encode_cursor(*values: Any) -> str:
+    """정렬 키 값을 불투명한 커서 문자열로 인코딩 (datetime은 ISO 형식, None은 null)"""
+    payload = json.dumps(list(values), default=_json_default, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def cursor_int(value: Any) -> int:
+    """커서 필드: 정수"""
+    if type(value) is not int or abs(value) > _MAX_INT:
+        raise ValueError("expected integer")
+    return value
+
+
+def cursor_datetime(value: Any) -> datetime:
+    """커서 필드: timezone 정보 없는 ISO 시각 (DB TIMESTAMP 컬럼과 같은 형식)"""
+    if not isinstance(value, str):
+        raise ValueError("expected ISO datetime")
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is not None:
+        raise ValueError("expected naive datetime")
+    return parsed
+
+
+def nullable(parser: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    """NULL일 수 있는 컬럼의 커서 필드"""
+    return lambda value: None if value is None else parser(value)
+
+
+def decode_cursor(cursor: str, *fields: Callable[[Any], Any]) -> List[Any]:
+    """
+    커서 문자열을 정렬 키 값 리스트로 디코딩
+
+    fields는 정렬 키 순서대로의 필드 파서 (cursor_int, cursor_datetime, nullable(...))
+    형식/개수/타입이 하나라도 맞지 않으면 SQL까지 가지 않고 400
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(values, list) or len(values) != len(fields):
+            raise ValueError("wrong cursor size")
+        return [parse(value) for parse, value in zip(fields, values)]
+    except (TypeError, ValueError, UnicodeDecodeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+
+def _is_nullable(column) -> bool:
+    return getattr(getattr(column, "expression", column), "nullable", True)
+
+
+# keyset 정렬 키: (컬럼, 내림차순 여부)
+SortKey = Tuple[Any, bool]
+
+
+def keyset_order(keys: Sequence[SortKey]) -> List[Any]:
+    """
+    ORDER BY 절 (NULL 위치를 명시)
+
+    Postgres 기본값과 같이 NULL을 가장 큰 값으로 취급 (ASC -> NULLS LAST, DESC -> NULLS FIRST)
+    기본 인덱스 정렬과 같으므로 인덱스 순서 그대로 사용 가능
+    """
+    return [column.desc().nulls_first() if descending else column.asc().nulls_last() for column, descending in keys]
+
+
+def keyset_filter(keys: Sequence[SortKey], values: Sequence[Any]):
+    """
+    keyset_order() 순서에서 커서 위치(values) 이후의 행만 남기는 조건
+
+    커서 값에 NULL이 없고 모든 키가 DESC면 인덱스를 그대로 쓰는 행 비교 (a, b) < (x, y)
+    (NULL 행은 커서보다 앞에 오므로 비교 결과가 NULL이어서 제외되는 것이 맞음)
+    그 외에는 NULL을 고려한 사전식 OR 조건
+    """
+    if None not in values and all(descending for _, descending in keys):
+        return tuple_(*[column for column, _ in keys]) < tuple_(*values)
+
+    conditions = []
+    equal = []
+    for (column, descending), value in zip(keys, values):
+        if value is None:
+            # NULL이 가장 큰 값: DESC에서는 NULL 아닌 행이 모두 뒤, ASC에서는 뒤에 오는 값이 없음
+            after = column.isnot(None) if descending else None
+            same = column.is_(None)
+        else:
+            after = column < value
+            if not descending:
+                after = column > value
+                if _is_nullable(column):
+                    after = or_(after, column.is_(None))
+            same = column == value
+
+        if after is not None:
+            conditions.append(and_(*equal, after))
+        equal.append(same)
+
+    if not conditions:
+        return false()
+    return or_(*conditions)
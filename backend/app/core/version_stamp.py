@@ -0,0 +1,57 @@
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.models.cache_version import CacheVersion
+
+# 버전 스탬프 이름
+CATEGORIES = "categories"
+TEMPLATES = "templates"
+TOPICS = "topics"  # 토픽 생성/수정/삭제/공개 전환 (카테고리별 토픽 수 등 집계 캐시용)
+
+
+def bump_version(db: Session, name: str) -> None:
+    """
+    컬렉션 버전 증가 (호출한 트랜잭션이 커밋될 때 함께 반영)
+    """
+    statement = insert(CacheVersion).values(
+        name=name,
+        version=1,
+        updated_at=func.current_timestamp()
+    ).on_conflict_do_update(
+        index_elements=[CacheVersion.name],
+        set_={
+            "version": CacheVersion.version + 1,
+            "updated_at": func.current_timestamp(),
+        }
+    )
+    db.execute(statement)
+
+
+def get_version(db: Session, name: str) -> Tuple[int, Optional[datetime]]:
+    """
+    (버전, 마지막 변경 시각) 조회 - 한 번도 변경되지 않았다면 (0, None)
+    """
+    row = db.query(CacheVersion.version, CacheVersion.updated_at).filter(
+        CacheVersion.name == name
+    ).first()
+
+    if row is None:
+        return 0, None
+    return row.version, row.updated_at
+
+
+def get_versions(db: Session, *names: str) -> Dict[str, Tuple[int, Optional[datetime]]]:
+    """
+    여러 스탬프를 한 번의 쿼리로 조회 - {이름: (버전, 마지막 변경 시각)}
+    """
+    rows = db.query(CacheVersion.name, CacheVersion.version, CacheVersion.updated_at).filter(
+        CacheVersion.name.in_(names)
+    ).all()
+
+    versions = {name: (0, None) for name in names}
+    versions.update({row.name: (row.version, row.updated_at) for row in rows})
+    return versions
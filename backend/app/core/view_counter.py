@@ -0,0 +1,117 @@
+import logging
+import threading
+from collections import defaultdict
+from typing import Dict
+
+from sqlalchemy import Integer, column, update, values
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models.topic import Topic
+
+logger = logging.getLogger(__name__)
+
+
+class ViewCountBuffer:
+    """
+    조회수 write-behind 버퍼
+
+    조회 요청마다 커밋하지 않고 토픽별 증가분을 메모리에 모았다가
+    주기적으로(또는 누적 건수가 flush_size에 도달하면) 한 번의 UPDATE로 반영
+    """
+
+    def __init__(self, flush_interval: float, flush_size: int):
+        self.flush_interval = flush_interval
+        self.flush_size = flush_size
+        self._pending: Dict[int, int] = defaultdict(int)
+        self._pending_total = 0
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._thread = None
+
+    def record(self, topic_id: int, count: int = 1) -> None:
+        """조회수 증가 기록 (DB 접근 없음)"""
+        with self._lock:
+            self._pending[topic_id] += count
+            self._pending_total += count
+            should_flush = self._pending_total >= self.flush_size
+
+        if should_flush:
+            self._wakeup.set()
+
+    def pending(self, topic_id: int) -> int:
+        """아직 DB에 반영되지 않은 조회수"""
+        with self._lock:
+            return self._pending.get(topic_id, 0)
+
+    def flush(self) -> int:
+        """누적된 증가분을 DB에 반영하고 반영한 토픽 수 반환"""
+        with self._lock:
+            if not self._pending:
+                return 0
+            pending = self._pending
+            self._pending = defaultdict(int)
+            self._pending_total = 0
+
+        increments = values(
+            column("topic_id", Integer),
+            column("amount", Integer),
+            name="increments"
+        ).data(list(pending.items()))
+
+        statement = (
+            update(Topic)
+            .where(Topic.id == increments.c.topic_id)
+            .values(
+                view_count=Topic.view_count + increments.c.amount,
+                # 조회는 내용 변경이 아니므로 updated_at 유지
+                updated_at=Topic.updated_at,
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+        db = SessionLocal()
+        try:
+            db.execute(statement)
+            db.commit()
+        except Exception:
+            db.rollback()
+            logger.exception("Failed to flush view counts; keeping them for the next flush")
+            with self._lock:
+                for topic_id, count in pending.items():
+                    self._pending[topic_id] += count
+                    self._pending_total += count
+            return 0
+        finally:
+            db.close()
+
+        return len(pending)
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name="view-count-flusher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """플러시 스레드 종료 후 남은 증가분 반영"""
+        if self._thread is not None:
+            self._stopping.set()
+            self._wakeup.set()
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self.flush()
+
+
+view_counter = ViewCountBuffer(
+    flush_interval=settings.VIEW_COUNT_FLUSH_INTERVAL_SECONDS,
+    flush_size=settings.VIEW_COUNT_FLUSH_SIZE,
+)
@@ -1,16 +1,38 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
+from app.core.compression import CompressionMiddleware
+from app.core.pagination import NEXT_CURSOR_HEADER
+from app.core.events import topic_events
+from app.core.view_counter import view_counter
+from app.services.study_events import study_compactor
 import logging
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 조회수 버퍼 플러시 스레드 시작, 종료 시 남은 조회수 반영
+    view_counter.start()
+    # 실시간 이벤트 브로커 (postgres 백엔드면 LISTEN 스레드 시작)
+    topic_events.start()
+    # 학습 이벤트 합산 스레드
+    study_compactor.start()
+    yield
+    study_compactor.stop()
+    topic_events.stop()
+    view_counter.stop()
+
+
 app = FastAPI(
     title="PE Subnote API",
     description="기술사 서브노트 관리 시스템 API",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # CORS origins 로깅
@@ -26,8 +48,12 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, "ETag", "Last-Modified"],
 )
 
+# 응답 압축 (br/gzip, 작은 응답과 미리 압축된 응답은 제외)
+app.add_middleware(CompressionMiddleware, minimum_size=settings.COMPRESSION_MIN_SIZE)
+
 @app.get("/")
 async def root():
     return {"message": "PE Subnote API is running"}
@@ -37,15 +63,19 @@ async def health_check():
     return {"status": "healthy"}
 
 # Import routers
-from app.api.routes import auth, users, categories, topics, templates, comments, bookmarks, read_counts, notes
+from app.api.routes import auth, users, categories, topics, topic_versions, templates, comments, bookmarks, read_counts, notes, home, progress, review
 
 # Include routers
 app.include_router(auth.router, prefix="/api/auth", tags=["auth"])
 app.include_router(users.router, prefix="/api/users", tags=["users"])
 app.include_router(categories.router, prefix="/api/categories", tags=["categories"])
 app.include_router(topics.router, prefix="/api/topics", tags=["topics"])
+app.include_router(topic_versions.router, tags=["topic-versions"])  # prefix already in router
 app.include_router(templates.router, prefix="/api/templates", tags=["templates"])
 app.include_router(comments.router, tags=["comments"])  # prefix already in router
 app.include_router(bookmarks.router, tags=["bookmarks"])  # prefix already in router
 app.include_router(read_counts.router, tags=["read-counts"])  # prefix already in router
 app.include_router(notes.router, tags=["notes"])  # prefix already in router
+app.include_router(home.router, tags=["home"])  # prefix already in router
+app.include_router(progress.router, tags=["progress"])  # prefix already in router
+app.include_router(review.router, tags=["review"])  # prefix already in router
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, TIMESTAMP, ForeignKey, func
+from sqlalchemy import Column, Integer, TIMESTAMP, ForeignKey, Index, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from app.core.database import Base
@@ -14,3 +14,8 @@ class UserBookmark(Base):
     # Relationships
     user = relationship("User")
     topic = relationship("Topic", backref="bookmarks")
+
+    __table_args__ = (
+        # 내 북마크 목록 keyset 페이지네이션 (정렬 키와 동일한 순서)
+        Index("idx_user_bookmarks_user_created", user_id, created_at.desc(), topic_id.desc()),
+    )
@@ -0,0 +1,15 @@
+from sqlalchemy import Column, String, BigInteger, TIMESTAMP, func
+from app.core.database import Base
+
+
+class CacheVersion(Base):
+    """
+    컬렉션 단위 버전 스탬프 (ETag 및 메모리 캐시 무효화용)
+
+    쓰기 트랜잭션 안에서 증가시키므로 여러 워커 간에도 일관됨
+    """
+    __tablename__ = "cache_versions"
+
+    name = Column(String(50), primary_key=True)  # 'categories', 'templates' 등
+    version = Column(BigInteger, nullable=False, default=0)
+    updated_at = Column(TIMESTAMP, server_default=func.current_timestamp(), onupdate=func.current_timestamp())
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Integer, TIMESTAMP, func, ForeignKey
+from sqlalchemy import Column, String, Integer, Text, TIMESTAMP, func, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from app.core.database import Base
 
@@ -12,6 +12,13 @@ class Category(Base):
     parent_id = Column(Integer, ForeignKey('categories.id'), nullable=True)
     order_index = Column(Integer, nullable=False, default=0)
     created_at = Column(TIMESTAMP, server_default=func.current_timestamp())
+    # 계층 인덱스 (materialized path): 루트부터 자신까지의 id 경로 ("/1/5/"), 루트의 depth는 0
+    path = Column(Text, nullable=False, default="")
+    depth = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        Index("idx_categories_path", path, postgresql_ops={"path": "text_pattern_ops"}),
+    )
 
     # Self-referential relationship for tree structure
     parent = relationship("Category", remote_side=[id], backref="children")
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, Text, TIMESTAMP, ForeignKey, func
+from sqlalchemy import Column, Integer, Text, TIMESTAMP, ForeignKey, Index, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from app.core.database import Base
@@ -16,6 +16,15 @@ class Comment(Base):
     created_at = Column(TIMESTAMP, server_default=func.current_timestamp())
     updated_at = Column(TIMESTAMP, server_default=func.current_timestamp(), onupdate=func.current_timestamp())
 
+    __table_args__ = (
+        # 최상위 댓글 페이지 / 답글 페이지 및 답글 수 (정렬 키: created_at DESC, id DESC)
+        Index(
+            "idx_comments_topic_threads", topic_id, created_at.desc(), id.desc(),
+            postgresql_where=parent_comment_id.is_(None)
+        ),
+        Index("idx_comments_parent_order", parent_comment_id, created_at.desc(), id.desc()),
+    )
+
     # Relationships
     topic = relationship("Topic", backref="comments")
     user = relationship("User", foreign_keys=[user_id])
@@ -0,0 +1,40 @@
+from sqlalchemy import Column, String, Integer, BigInteger, Boolean, Date, TIMESTAMP, ForeignKey, Index, func
+from sqlalchemy.dialects.postgresql import UUID
+from app.core.database import Base
+
+
+class StudyEvent(Base):
+    """
+    학습 이벤트 로그 (추가만 하는 테이블, occurred_at 기준 월별 파티션)
+
+    주기적으로 StudyDailyRollup에 합산(compacted=True)되고 보관 기간이 지나면 삭제됨
+    (app.services.study_events 참고)
+    """
+    __tablename__ = "study_events"
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    occurred_at = Column(TIMESTAMP, primary_key=True, server_default=func.current_timestamp())
+    user_id = Column(UUID(as_uuid=True), nullable=False)
+    topic_id = Column(Integer, nullable=True)
+    category_id = Column(Integer, nullable=True)  # 기록 시점의 토픽 카테고리
+    event_type = Column(String(20), nullable=False)  # 'read', 'bookmark', 'note'
+    amount = Column(Integer, nullable=False, default=1)  # 회독 수 / 북마크 +1, -1 / 메모 1
+    compacted = Column(Boolean, nullable=False, default=False)
+
+    __table_args__ = (
+        Index("idx_study_events_pending", occurred_at, postgresql_where=compacted.is_(False)),
+        {"postgresql_partition_by": "RANGE (occurred_at)"},
+    )
+
+
+class StudyDailyRollup(Base):
+    """사용자/일/카테고리별 학습량 (진도 API는 이 테이블만 조회)"""
+    __tablename__ = "study_daily_rollups"
+
+    user_id = Column(UUID(as_uuid=True), ForeignKey('users.id', ondelete='CASCADE'), primary_key=True)
+    day = Column(Date, primary_key=True)  # STUDY_TIMEZONE 기준 날짜
+    category_id = Column(Integer, primary_key=True, default=0)  # 카테고리 없음 = 0
+    reads = Column(Integer, nullable=False, default=0)
+    bookmarks = Column(Integer, nullable=False, default=0)
+    notes = Column(Integer, nullable=False, default=0)
+    updated_at = Column(TIMESTAMP, server_default=func.current_timestamp(), onupdate=func.current_timestamp())
@@ -1,6 +1,6 @@
-from sqlalchemy import Column, String, Integer, Text, Boolean, TIMESTAMP, ForeignKey, func
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, Integer, Text, Boolean, TIMESTAMP, ForeignKey, Index, func
+from sqlalchemy.dialects.postgresql import UUID, TSVECTOR
+from sqlalchemy.orm import relationship, deferred
 from app.core.database import Base
 
 
@@ -16,10 +16,19 @@ class Topic(Base):
     created_by = Column(UUID(as_uuid=True), ForeignKey('users.id'), nullable=True)
     is_published = Column(Boolean, default=True)
     view_count = Column(Integer, default=0)
+    comments_count = Column(Integer, default=0)  # 댓글 수 (comments 라우트에서 갱신, reconcile_counters.py로 재계산)
     order_index = Column(Integer, default=0)
     importance_level = Column(Integer, default=3)  # 1~5 별점
     created_at = Column(TIMESTAMP, server_default=func.current_timestamp())
     updated_at = Column(TIMESTAMP, server_default=func.current_timestamp(), onupdate=func.current_timestamp())
+    # 전문 검색용 (제목/키워드/암기두음법/본문, app.services.topic_search에서 생성)
+    search_vector = deferred(Column(TSVECTOR, nullable=True))
+
+    __table_args__ = (
+        Index("idx_topics_search_vector", "search_vector", postgresql_using="gin"),
+        Index("idx_topics_list_order", order_index, created_at.desc(), id),
+        Index("idx_topics_category_order", category_id, order_index, created_at.desc(), id),
+    )
 
     # Relationships
     category = relationship("Category", backref="topics")
@@ -0,0 +1,33 @@
+from sqlalchemy import Column, String, Integer, Text, Boolean, TIMESTAMP, ForeignKey, UniqueConstraint, func
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import relationship
+from app.core.database import Base
+
+
+class TopicVersion(Base):
+    """
+    서브노트 수정 이력
+
+    본문은 N번째마다 전체 스냅샷, 그 사이에는 직전 버전 대비 delta로 저장
+    (app.services.topic_versions 참고)
+    """
+    __tablename__ = "topic_versions"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    topic_id = Column(Integer, ForeignKey('topics.id', ondelete='CASCADE'), nullable=False)
+    version = Column(Integer, nullable=False)  # 토픽별 1부터 증가
+    is_snapshot = Column(Boolean, nullable=False, default=False)
+    title = Column(String(200), nullable=False)
+    keywords = Column(String(500), nullable=True)
+    mnemonic = Column(Text, nullable=True)
+    content_data = Column(Text, nullable=False)  # 스냅샷: 전체 본문, 그 외: JSON delta
+    content_length = Column(Integer, nullable=False, default=0)
+    created_by = Column(UUID(as_uuid=True), ForeignKey('users.id', ondelete='SET NULL'), nullable=True)
+    created_at = Column(TIMESTAMP, server_default=func.current_timestamp())
+
+    __table_args__ = (
+        UniqueConstraint('topic_id', 'version', name='uq_topic_versions_topic_version'),
+    )
+
+    # Relationships
+    creator = relationship("User", foreign_keys=[created_by])
@@ -1,7 +1,10 @@
 from pydantic import BaseModel
 from datetime import datetime
+from typing import Optional
 from uuid import UUID
 
+from app.schemas.topic import CategoryInfo
+
 
 class BookmarkCreate(BaseModel):
     topic_id: int
@@ -14,3 +17,14 @@ class BookmarkResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class BookmarkListItem(BookmarkResponse):
+    """북마크 목록 항목 (토픽 요약 + 내 회독 수 포함, 본문 제외)"""
+    title: str
+    category_id: Optional[int] = None
+    category: Optional[CategoryInfo] = None
+    importance_level: int
+    is_published: bool
+    read_count: int = 0
+    last_read_at: Optional[datetime] = None
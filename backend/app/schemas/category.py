@@ -24,11 +24,16 @@ class CategoryResponse(CategoryBase):
     id: int
     order_index: int
     created_at: datetime
+    depth: int = 0
 
     model_config = {"from_attributes": True}
 
 
 class CategoryTree(CategoryResponse):
+    # /tree?with_counts=true 일 때만 포함
+    topic_count: Optional[int] = None  # 이 카테고리에 직접 속한 토픽 수
+    subtree_topic_count: Optional[int] = None  # 하위 카테고리까지 포함한 토픽 수
+    max_importance_level: Optional[int] = None  # 하위 카테고리까지 포함한 최대 중요도 (토픽이 없으면 null)
     children: List['CategoryTree'] = []
 
     model_config = {"from_attributes": True}
@@ -39,3 +44,12 @@ class CategoryReorder(BaseModel):
     id: int
     parent_id: Optional[int] = None
     order_index: int
+
+
+# For bulk tree mutation (drag & drop of many categories at once)
+class CategoryBulkMove(BaseModel):
+    moves: List[CategoryReorder] = Field(..., min_length=1)
+
+
+class CategoryBulkMoveResult(BaseModel):
+    updated: int
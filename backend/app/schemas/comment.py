@@ -45,3 +45,20 @@ class CommentResponse(CommentBase):
 
 # 재귀 타입 업데이트
 CommentResponse.model_rebuild()
+
+
+class CommentThread(CommentResponse):
+    """페이지 단위 조회용 댓글 (답글은 포함하지 않고 개수만 제공)"""
+    reply_count: int = 0  # 바로 아래 답글 수
+
+
+class CommentPage(BaseModel):
+    items: List[CommentThread]
+    next_cursor: Optional[str] = None  # 다음 페이지 요청 시 cursor로 전달 (마지막 페이지면 null)
+
+
+class CommentLikeResult(BaseModel):
+    """좋아요 토글 결과"""
+    comment_id: int
+    is_liked: bool
+    likes_count: int
@@ -0,0 +1,19 @@
+from pydantic import BaseModel
+from datetime import datetime
+from typing import List, Optional
+
+from app.schemas.category import CategoryTree
+from app.schemas.topic import TopicListItem
+
+
+class HomeReadCount(BaseModel):
+    topic_id: int
+    count: int
+    last_read_at: Optional[datetime] = None
+
+
+class HomeBundle(BaseModel):
+    categories: List[CategoryTree]
+    topics: List[TopicListItem]
+    bookmarks: List[int]  # 북마크한 topic_id (최근 순)
+    read_counts: List[HomeReadCount]
@@ -0,0 +1,25 @@
+from pydantic import BaseModel
+from datetime import date
+from typing import Optional
+
+
+class DailyProgress(BaseModel):
+    day: date
+    reads: int
+    bookmarks: int  # 추가 - 제거
+    notes: int
+
+
+class CategoryProgress(BaseModel):
+    category_id: Optional[int]  # 카테고리 없는 토픽은 null
+    category_name: Optional[str]
+    reads: int
+    bookmarks: int
+    notes: int
+    last_studied_on: date
+
+
+class StudyStreak(BaseModel):
+    current: int  # 오늘(또는 어제)까지 이어진 연속 학습일
+    longest: int
+    last_studied_on: Optional[date]
@@ -1,5 +1,6 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from datetime import datetime
+from typing import List, Optional
 from uuid import UUID
 
 
@@ -16,3 +17,19 @@ class ReadCountResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class ReadCountEvent(BaseModel):
+    """오프라인 중 쌓인 회독 기록 하나"""
+    topic_id: int
+    delta: int = Field(1, ge=1, le=100)
+    read_at: Optional[datetime] = None  # 없으면 서버 시각
+
+
+class ReadCountBatch(BaseModel):
+    events: List[ReadCountEvent] = Field(..., min_length=1, max_length=1000)
+
+
+class ReadCountBatchResult(BaseModel):
+    read_counts: List[ReadCountResponse]  # 반영 후 토픽별 회독 카운트
+    skipped_topic_ids: List[int]  # 존재하지 않아 무시된 토픽
@@ -0,0 +1,14 @@
+from pydantic import BaseModel
+from datetime import datetime
+from typing import Optional
+
+
+class ReviewItem(BaseModel):
+    topic_id: int
+    title: str
+    category_id: Optional[int]
+    importance_level: Optional[int]
+    read_count: int  # 0이면 아직 읽지 않은 토픽
+    last_read_at: Optional[datetime]
+    due_at: Optional[datetime]  # 읽지 않은 토픽은 null (가장 먼저 복습)
+    overdue: bool
@@ -1,6 +1,6 @@
 from pydantic import BaseModel, Field
 from datetime import datetime
-from typing import Optional
+from typing import Optional, List
 from uuid import UUID
 
 
@@ -66,3 +66,31 @@ class TopicListItem(BaseModel):
     updated_at: datetime
 
     model_config = {"from_attributes": True}
+
+
+class TopicSearchResult(BaseModel):
+    """검색 결과 (관련도 순)"""
+    id: int
+    title: str
+    category_id: Optional[int] = None
+    category: Optional[CategoryInfo] = None
+    is_published: bool
+    importance_level: int
+    keywords: Optional[str] = None
+    rank: float
+    snippet: Optional[str] = None  # <mark>로 강조된 본문 일부
+
+    model_config = {"from_attributes": True}
+
+
+class TopicImportError(BaseModel):
+    """가져오기 실패한 줄"""
+    line: int
+    message: str
+
+
+class TopicImportResult(BaseModel):
+    """NDJSON 가져오기 결과"""
+    imported: int
+    failed: int
+    errors: List[TopicImportError] = []
@@ -0,0 +1,36 @@
+from pydantic import BaseModel
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+
+class TopicVersionListItem(BaseModel):
+    """버전 목록용 정보 (본문 제외)"""
+    version: int
+    title: str
+    is_snapshot: bool
+    content_length: int
+    created_by: Optional[UUID] = None
+    created_at: datetime
+
+    model_config = {"from_attributes": True}
+
+
+class TopicVersionResponse(BaseModel):
+    """특정 버전 미리보기"""
+    topic_id: int
+    version: int
+    title: str
+    keywords: Optional[str] = None
+    mnemonic: Optional[str] = None
+    content: str
+    created_by: Optional[UUID] = None
+    created_at: datetime
+
+
+class TopicVersionDiff(BaseModel):
+    """두 버전 간 비교 (unified diff)"""
+    topic_id: int
+    from_version: int
+    to_version: int
+    diff: str
@@ -0,0 +1,33 @@
+import time
+from typing import FrozenSet
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from app.core.cache import LRUCache
+from app.core.config import settings
+from app.models.bookmark import UserBookmark
+
+# 사용자별 북마크 토픽 id 집합: user_id -> (구성 시각, frozenset)
+# 같은 워커의 토글은 즉시 무효화, 다른 워커의 토글은 BOOKMARK_CACHE_TTL_SECONDS 안에 반영
+bookmark_cache = LRUCache(max_bytes=settings.BOOKMARK_CACHE_MAX_BYTES, name="bookmark-ids")
+
+# 항목 하나의 대략적인 메모리 크기 (캐시 한도 계산용)
+_BASE_BYTES = 256
+_ID_BYTES = 64
+
+
+def get_bookmark_ids(db: Session, user_id: UUID) -> FrozenSet[int]:
+    """사용자가 북마크한 토픽 id 집합 (캐시가 없거나 오래됐으면 한 번의 쿼리로 구성)"""
+    cached = bookmark_cache.get(user_id)
+    if cached is not None and time.monotonic() - cached[0] < settings.BOOKMARK_CACHE_TTL_SECONDS:
+        return cached[1]
+
+    rows = db.query(UserBookmark.topic_id).filter(UserBookmark.user_id == user_id).all()
+    ids = frozenset(row.topic_id for row in rows)
+    bookmark_cache.set(user_id, (time.monotonic(), ids), size=_BASE_BYTES + _ID_BYTES * len(ids))
+    return ids
+
+
+def invalidate(user_id: UUID) -> None:
+    bookmark_cache.invalidate(user_id)
@@ -0,0 +1,180 @@
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+from fastapi import HTTPException
+from sqlalchemy import Integer, Text, cast, column, func, literal, update, values
+from sqlalchemy.orm import Session
+
+from app.models.category import Category
+from app.schemas.category import CategoryReorder
+
+
+def child_path(parent: Optional[Category], category_id: int) -> str:
+    """부모 경로 뒤에 자신의 id를 붙인 경로 ("/1/5/")"""
+    return f"{parent.path if parent is not None else '/'}{category_id}/"
+
+
+def ancestor_ids(path: str) -> List[int]:
+    """경로에 포함된 조상 id (루트부터, 자기 자신 제외)"""
+    return [int(part) for part in path.strip("/").split("/")[:-1]]
+
+
+def is_in_subtree(category: Category, candidate: Category) -> bool:
+    """candidate가 category 자신이거나 그 하위 카테고리인지 (쿼리 없이 경로 접두사로 판단)"""
+    return candidate.path.startswith(category.path)
+
+
+def assign_path(db: Session, category: Category, parent: Optional[Category]) -> None:
+    """
+    새로 추가된 카테고리의 경로/깊이 설정
+
+    경로에 자신의 id가 들어가므로 flush로 id를 먼저 받음
+    """
+    db.flush()
+    category.path = child_path(parent, category.id)
+    category.depth = parent.depth + 1 if parent is not None else 0
+
+
+def move_subtree(db: Session, category: Category, new_parent: Optional[Category]) -> None:
+    """
+    카테고리를 새 부모 아래로 옮기면서 하위 트리 전체의 경로/깊이를 한 번의 UPDATE로 갱신
+
+    순환 참조 여부는 호출하는 쪽에서 is_in_subtree()로 먼저 확인해야 함
+    """
+    old_path = category.path
+    new_path = child_path(new_parent, category.id)
+    depth_delta = (new_parent.depth + 1 if new_parent is not None else 0) - category.depth
+
+    category.parent_id = new_parent.id if new_parent is not None else None
+    if new_path == old_path:
+        return
+
+    db.execute(
+        update(Category)
+        .where(Category.path.like(f"{old_path}%"))
+        .values(
+            path=literal(new_path) + func.substr(Category.path, len(old_path) + 1),
+            depth=Category.depth + depth_delta
+        )
+        .execution_options(synchronize_session="fetch")
+    )
+
+
+def descendants_query(db: Session, category: Category):
+    """하위 카테고리 전체 (자신 제외, 얕은 순서대로)"""
+    return db.query(Category).filter(
+        Category.path.like(f"{category.path}%"),
+        Category.id != category.id
+    ).order_by(Category.depth, Category.order_index, Category.id)
+
+
+def ancestors_query(db: Session, category: Category):
+    """조상 카테고리 전체 (루트부터)"""
+    return db.query(Category).filter(
+        Category.id.in_(ancestor_ids(category.path))
+    ).order_by(Category.depth)
+
+
+def apply_bulk_moves(db: Session, moves: List[CategoryReorder]) -> int:
+    """
+    여러 카테고리의 부모/순서 변경을 한 번에 적용하고 변경된 카테고리 수 반환 (커밋은 호출하는 쪽에서)
+
+    전체 카테고리를 한 번 읽어 메모리에서 결과 트리를 검증한 뒤
+    (없는 id, 없는 부모, 순환 참조, 같은 부모 아래 중복 이름)
+    부모/순서/경로/깊이를 한 번의 UPDATE ... FROM (VALUES ...)로 반영
+    """
+    # 동시에 실행되는 트리 변경과 섞이지 않도록 전체 카테고리 행을 잠금
+    rows = db.query(
+        Category.id,
+        Category.name,
+        Category.parent_id,
+        Category.order_index,
+        Category.path,
+        Category.depth
+    ).with_for_update().all()
+    current = {row.id: row for row in rows}
+
+    requested = [move.id for move in moves]
+    if len(set(requested)) != len(requested):
+        duplicated = sorted({category_id for category_id in requested if requested.count(category_id) > 1})
+        raise HTTPException(status_code=400, detail=f"Duplicate category ids in request: {duplicated}")
+
+    unknown = sorted(move.id for move in moves if move.id not in current)
+    if unknown:
+        raise HTTPException(status_code=404, detail=f"Categories not found: {unknown}")
+
+    parent_of = {row.id: row.parent_id for row in rows}
+    order_of = {row.id: row.order_index for row in rows}
+    for move in moves:
+        parent_of[move.id] = move.parent_id
+        order_of[move.id] = move.order_index
+
+    dangling = sorted(
+        category_id for category_id, parent_id in parent_of.items()
+        if parent_id is not None and parent_id not in current
+    )
+    if dangling:
+        raise HTTPException(status_code=404, detail=f"Parent category not found for: {dangling}")
+
+    # 루트부터 내려가며 새 경로 계산, 도달하지 못한 노드는 순환에 포함된 것
+    children: Dict[Optional[int], List[int]] = defaultdict(list)
+    for category_id, parent_id in parent_of.items():
+        children[parent_id].append(category_id)
+
+    paths: Dict[int, str] = {}
+    depths: Dict[int, int] = {}
+    stack = [(category_id, "/", 0) for category_id in children[None]]
+    while stack:
+        category_id, parent_path, depth = stack.pop()
+        paths[category_id] = f"{parent_path}{category_id}/"
+        depths[category_id] = depth
+        stack.extend((child_id, paths[category_id], depth + 1) for child_id in children[category_id])
+
+    cyclic = sorted(set(current) - set(paths))
+    if cyclic:
+        raise HTTPException(status_code=400, detail=f"Cannot create circular reference: {cyclic}")
+
+    # 이번 요청으로 옮겨진 카테고리가 포함된 형제 그룹만 이름 중복 검사 (기존 데이터는 그대로 허용)
+    moved_parents = {parent_of[move.id] for move in moves}
+    names = set()
+    for parent_id in moved_parents:
+        for category_id in children[parent_id]:
+            key = (parent_id, current[category_id].name)
+            if key in names:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Category with this name already exists under the same parent: {current[category_id].name}"
+                )
+            names.add(key)
+
+    changed = [
+        (category_id, parent_of[category_id], order_of[category_id], paths[category_id], depths[category_id])
+        for category_id, row in current.items()
+        if (row.parent_id, row.order_index, row.path, row.depth)
+        != (parent_of[category_id], order_of[category_id], paths[category_id], depths[category_id])
+    ]
+    if not changed:
+        return 0
+
+    changes = values(
+        column("id", Integer),
+        column("parent_id", Integer),
+        column("order_index", Integer),
+        column("path", Text),
+        column("depth", Integer),
+        name="changes"
+    ).data(changed)
+
+    db.execute(
+        update(Category)
+        .where(Category.id == changes.c.id)
+        .values(
+            # 루트로만 옮기는 경우 VALUES 열이 모두 NULL(text)로 추론되므로 명시적으로 캐스팅
+            parent_id=cast(changes.c.parent_id, Integer),
+            order_index=changes.c.order_index,
+            path=changes.c.path,
+            depth=changes.c.depth
+        )
+        .execution_options(synchronize_session=False)
+    )
+    return len(changed)
@@ -0,0 +1,210 @@
+import json
+import threading
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from pydantic import TypeAdapter
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.core.version_stamp import CATEGORIES, get_version
+from app.models.category import Category
+from app.models.topic import Topic
+
+
+class CategoryTreeSnapshot:
+    """
+    특정 버전의 카테고리 트리
+
+    parent_id 인덱스로 한 번에 트리를 구성하고, 직렬화된 JSON을 함께 보관 (필드 순서는 CategoryTree 응답 모델과 동일)
+    """
+
+    def __init__(self, version: int, rows: Iterable):
+        self.version = version
+        self.nodes: Dict[int, dict] = {}
+        self.roots: List[dict] = []
+
+        rows = list(rows)
+        for row in rows:
+            self.nodes[row.id] = {
+                "name": row.name,
+                "description": row.description,
+                "parent_id": row.parent_id,
+                "id": row.id,
+                "order_index": row.order_index,
+                "created_at": row.created_at,
+                "depth": row.depth,
+                "children": [],
+            }
+
+        for row in rows:
+            node = self.nodes[row.id]
+            if row.parent_id is None:
+                self.roots.append(node)
+            else:
+                parent = self.nodes.get(row.parent_id)
+                # 부모가 없는 고아 노드는 루트에서 도달할 수 없으므로 트리에서 제외 (기존 동작과 동일)
+                if parent is not None:
+                    parent["children"].append(node)
+
+        _sort_children(self.roots)
+        self.payload = _dump(self.roots)
+
+    def preorder(self) -> List[dict]:
+        """모든 노드 (트리 표시 순서, 전위 순회)"""
+        nodes = []
+        stack = list(reversed(self.roots))
+        while stack:
+            node = stack.pop()
+            nodes.append(node)
+            stack.extend(reversed(node["children"]))
+        return nodes
+
+    def with_topic_counts(self, counts: Dict[int, Tuple[int, Optional[int]]]) -> bytes:
+        """
+        노드별 토픽 수를 덧붙인 트리 JSON
+
+        counts: {category_id: (토픽 수, 최대 중요도)} - 카테고리별 GROUP BY 결과
+        - topic_count: 해당 카테고리에 직접 속한 토픽 수
+        - subtree_topic_count: 하위 카테고리까지 포함한 토픽 수
+        - max_importance_level: 하위 카테고리까지 포함한 최대 중요도 (토픽이 없으면 null)
+        """
+        annotated: Dict[int, dict] = {}
+        order = self.preorder()
+        for node in order:
+            topic_count, max_importance = counts.get(node["id"], (0, None))
+            annotated[node["id"]] = {
+                **{key: value for key, value in node.items() if key != "children"},
+                "topic_count": topic_count,
+                "subtree_topic_count": topic_count,
+                "max_importance_level": max_importance,
+                "children": [],
+            }
+
+        # 역순(자식이 부모보다 먼저)으로 한 번 훑으며 부모에 합산
+        for node in reversed(order):
+            parent = annotated.get(node["parent_id"]) if node["parent_id"] is not None else None
+            if parent is None:
+                continue
+            child = annotated[node["id"]]
+            parent["subtree_topic_count"] += child["subtree_topic_count"]
+            if child["max_importance_level"] is not None:
+                parent["max_importance_level"] = max(
+                    parent["max_importance_level"] or 0, child["max_importance_level"]
+                )
+
+        for node in order:
+            annotated[node["id"]]["children"] = [annotated[child["id"]] for child in node["children"]]
+
+        return _dump([annotated[node["id"]] for node in self.roots])
+
+    def subtree_ids(self, category_id: int) -> List[int]:
+        """카테고리와 모든 하위 카테고리 id (트리 표시 순서, 전위 순회)"""
+        root = self.nodes.get(category_id)
+        if root is None:
+            return []
+
+        ids = []
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            ids.append(node["id"])
+            stack.extend(reversed(node["children"]))
+        return ids
+
+
+def _sort_children(roots: List[dict]) -> None:
+    # 재귀 없이 모든 레벨을 order_index로 정렬
+    stack = [roots]
+    while stack:
+        children = stack.pop()
+        children.sort(key=lambda node: node["order_index"])
+        stack.extend(node["children"] for node in children if node["children"])
+
+
+_datetime_adapter = TypeAdapter(datetime)
+
+
+def _dump(nodes: List[dict]) -> bytes:
+    return json.dumps(nodes, default=_json_default, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def _json_default(value):
+    # 응답 모델(CategoryTree)과 같은 형식으로 datetime 직렬화
+    return _datetime_adapter.dump_python(value, mode="json")
+
+
+_lock = threading.Lock()
+_snapshot: Optional[CategoryTreeSnapshot] = None
+
+
+def get_category_tree(db: Session, version: Optional[int] = None) -> CategoryTreeSnapshot:
+    """
+    카테고리 버전 스탬프 기준으로 캐시된 트리 반환 (버전이 바뀌었을 때만 다시 구성)
+
+    version: 호출하는 쪽에서 이미 조회한 버전 (ETag 계산 등), 없으면 조회
+    """
+    global _snapshot
+
+    if version is None:
+        version, _ = get_version(db, CATEGORIES)
+
+    snapshot = _snapshot
+    if snapshot is not None and snapshot.version == version:
+        return snapshot
+
+    rows = db.query(
+        Category.id,
+        Category.name,
+        Category.description,
+        Category.parent_id,
+        Category.order_index,
+        Category.created_at,
+        Category.depth
+    ).all()
+    snapshot = CategoryTreeSnapshot(version, rows)
+
+    with _lock:
+        if _snapshot is None or _snapshot.version <= version:
+            _snapshot = snapshot
+    return snapshot
+
+
+# (카테고리 버전, 토픽 버전, 비공개 포함 여부) -> 토픽 수가 포함된 트리 JSON
+_counts_cache: Dict[bool, Tuple[Tuple[int, int], bytes]] = {}
+
+
+def get_category_tree_with_counts(
+    db: Session,
+    categories_version: int,
+    topics_version: int,
+    include_unpublished: bool = False
+) -> bytes:
+    """
+    토픽 수가 포함된 트리 JSON (카테고리/토픽 버전 스탬프가 바뀌었을 때만 다시 집계)
+
+    집계는 topics 테이블에 대한 GROUP BY 한 번, 하위 트리 합산은 메모리에서 수행
+    """
+    key = (categories_version, topics_version)
+    cached = _counts_cache.get(include_unpublished)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    tree = get_category_tree(db, categories_version)
+
+    query = db.query(
+        Topic.category_id,
+        func.count(Topic.id),
+        func.max(Topic.importance_level)
+    ).filter(Topic.category_id.isnot(None))
+    if not include_unpublished:
+        query = query.filter(Topic.is_published.is_(True))
+    counts = {
+        category_id: (topic_count, max_importance)
+        for category_id, topic_count, max_importance in query.group_by(Topic.category_id)
+    }
+
+    payload = tree.with_topic_counts(counts)
+    with _lock:
+        _counts_cache[include_unpublished] = (key, payload)
+    return payload
@@ -0,0 +1,104 @@
+import hashlib
+import json
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.core.compression import SplicedBody
+from app.core.config import settings
+from app.core.version_stamp import CATEGORIES, TOPICS, get_versions
+from app.models.bookmark import UserBookmark
+from app.models.read_count import UserReadCount
+from app.models.topic import Topic
+from app.services import category_tree
+from app.services.topic_summary import topic_summary_query, dump_list_items
+
+
+class SharedBundle:
+    """
+    모든 사용자에게 같은 홈 번들 앞부분 ('{"categories":[...],"topics":[...]')
+
+    사용자별 부분(북마크/회독)은 render()에서 뒤에 덧붙이며, 압축본도 인코딩별로 한 번만 생성
+    """
+
+    def __init__(self, key: Tuple[int, int], payload: bytes):
+        self.key = key
+        self.payload = payload
+        self.digest = hashlib.sha1(payload).hexdigest()
+        self.built_at = time.monotonic()
+        self._compressed: Dict[str, SplicedBody] = {}
+        self._lock = threading.Lock()
+
+    def is_fresh(self, key: Tuple[int, int]) -> bool:
+        return self.key == key and time.monotonic() - self.built_at < settings.HOME_BUNDLE_TTL_SECONDS
+
+    def render(self, tail: bytes, encoding: Optional[str] = None) -> bytes:
+        if encoding is None:
+            return self.payload + tail
+
+        with self._lock:
+            compressed = self._compressed.get(encoding)
+            if compressed is None:
+                compressed = SplicedBody(self.payload, encoding)
+                self._compressed[encoding] = compressed
+        return compressed.render(tail)
+
+
+_lock = threading.Lock()
+_shared: Optional[SharedBundle] = None
+
+
+def get_shared_bundle(db: Session) -> SharedBundle:
+    """
+    카테고리/토픽 버전 스탬프 기준으로 캐시된 공용 부분 반환
+
+    조회수는 버전 스탬프를 바꾸지 않으므로 HOME_BUNDLE_TTL_SECONDS마다 다시 구성
+    """
+    global _shared
+
+    versions = get_versions(db, CATEGORIES, TOPICS)
+    key = (versions[CATEGORIES][0], versions[TOPICS][0])
+
+    shared = _shared
+    if shared is not None and shared.is_fresh(key):
+        return shared
+
+    tree = category_tree.get_category_tree(db, key[0])
+    rows = topic_summary_query(db).filter(Topic.is_published.is_(True)).order_by(
+        Topic.order_index, Topic.created_at.desc(), Topic.id
+    ).all()
+    shared = SharedBundle(key, b'{"categories":' + tree.payload + b',"topics":' + dump_list_items(rows))
+
+    with _lock:
+        _shared = shared
+    return shared
+
+
+def user_overlay(db: Session, user_id) -> bytes:
+    """사용자별 부분 (',"bookmarks":[...],"read_counts":[...]}')"""
+    bookmarks = db.query(UserBookmark.topic_id).filter(
+        UserBookmark.user_id == user_id
+    ).order_by(UserBookmark.created_at.desc()).all()
+
+    read_counts = db.query(
+        UserReadCount.topic_id,
+        UserReadCount.count,
+        UserReadCount.last_read_at
+    ).filter(
+        UserReadCount.user_id == user_id
+    ).order_by(UserReadCount.last_read_at.desc()).all()
+
+    overlay = {
+        "bookmarks": [row.topic_id for row in bookmarks],
+        "read_counts": [
+            {
+                "topic_id": row.topic_id,
+                "count": row.count,
+                "last_read_at": row.last_read_at.isoformat() if row.last_read_at else None,
+            }
+            for row in read_counts
+        ],
+    }
+    return b"," + json.dumps(overlay, ensure_ascii=False, separators=(",", ":")).encode()[1:]
@@ -0,0 +1,256 @@
+import heapq
+import math
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from app.core.cache import LRUCache
+from app.core.config import settings
+from app.models.read_count import UserReadCount
+from app.models.topic import Topic
+
+# 복습 간격 상한
+REVIEW_MAX_INTERVAL_DAYS = 180.0
+
+# 간격 계산에 쓰는 회독 지수 상한 (큰 회독 수에서 2 ** n의 float 변환 OverflowError 방지)
+# 기본 간격 x 중요도 배율(최소 1/3)이 1e-10일 이상이면 이 지수에서 이미 간격 상한을 넘음
+_MAX_INTERVAL_EXPONENT = math.ceil(math.log2(REVIEW_MAX_INTERVAL_DAYS * 3 / 1e-10)) + 1
+
+# 아직 읽지 않은 토픽의 복습 예정 시각 (모든 읽은 토픽보다 먼저)
+_UNREAD_DUE = 0.0
+
+# 엔트리 하나의 대략적인 메모리 크기 (캐시 한도 계산용)
+_ENTRY_BYTES = 200
+
+
+def review_interval(count: int, importance_level: Optional[int]) -> timedelta:
+    """
+    회독 수/중요도(1~5)에 따른 다음 복습까지의 간격
+
+    기본 간격에서 시작해 회독마다 2배, 중요도가 높을수록 짧게 (5: 1/3배, 3: 1배, 1: 5/3배)
+    """
+    importance = min(max(importance_level or 3, 1), 5)
+    exponent = min(max(count - 1, 0), _MAX_INTERVAL_EXPONENT)
+    days = settings.REVIEW_BASE_INTERVAL_DAYS * 2 ** exponent * (6 - importance) / 3
+    return timedelta(days=min(days, REVIEW_MAX_INTERVAL_DAYS))
+
+
+def due_timestamp(count: int, last_read_at: Optional[datetime], importance_level: Optional[int]) -> float:
+    """다음 복습 예정 시각 (UTC epoch 초, 읽은 적 없으면 0)"""
+    if not count or last_read_at is None:
+        return _UNREAD_DUE
+    # DB의 TIMESTAMP 컬럼은 timezone 정보 없이 UTC로 저장
+    due = last_read_at.replace(tzinfo=timezone.utc) + review_interval(count, importance_level)
+    return due.timestamp()
+
+
+@dataclass
+class ReviewTopic:
+    """복습 대상 토픽 (공개 토픽, 모든 사용자 공용)"""
+    id: int
+    title: str
+    category_id: Optional[int]
+    importance_level: Optional[int]
+    order_index: int
+
+    @property
+    def sort_key(self) -> Tuple:
+        # 예정 시각이 같으면 중요도 높은 순, 목록 순서, id
+        return -(self.importance_level or 0), self.order_index, self.id
+
+
+@dataclass
+class ReviewState:
+    """사용자별 토픽 회독 상태"""
+    count: int
+    last_read_at: Optional[datetime]
+    due: float
+
+
+# 읽지 않은 토픽의 상태 (모든 사용자 공용)
+UNREAD = ReviewState(count=0, last_read_at=None, due=_UNREAD_DUE)
+
+
+class ReviewCatalog:
+    """
+    공개 토픽 메타데이터 + 읽지 않은 토픽의 복습 순서 (토픽 버전 스탬프 단위로 한 벌만 유지)
+
+    사용자별 큐에는 읽은 토픽만 들어가고, 읽지 않은 토픽은 여기의 정렬된 목록을 공유
+    """
+
+    def __init__(self, version: int, topics: Dict[int, ReviewTopic]):
+        self.version = version
+        self.topics = topics
+        self.unread_order: List[ReviewTopic] = sorted(topics.values(), key=lambda topic: topic.sort_key)
+
+
+class ReviewQueue:
+    """
+    사용자 한 명의 복습 큐
+
+    - 읽은 토픽: 복습 예정 시각 기준 최소 힙 (회독이 기록되면 새 엔트리를 넣고 이전 엔트리는 꺼낼 때 버림)
+    - 읽지 않은 토픽: 공용 ReviewCatalog.unread_order에서 읽은 토픽만 건너뛰며 순서대로
+    읽지 않은 토픽은 예정 시각이 0이므로 두 목록을 같은 키로 병합하면 전체 순서가 됨
+    """
+
+    def __init__(self, catalog: ReviewCatalog, states: Dict[int, ReviewState]):
+        self.catalog = catalog
+        self.version = catalog.version
+        self.built_at = time.monotonic()
+        self._states = states
+        # 토픽별 현재 유효한 힙 엔트리 (같은 객체인지로 이전 엔트리를 구분)
+        self._current: Dict[int, Tuple] = {topic_id: self._entry(topic_id) for topic_id in states}
+        self._heap: List[Tuple] = list(self._current.values())
+        heapq.heapify(self._heap)
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        # 읽은 토픽 수에만 비례 (토픽 메타데이터는 공용)
+        return _ENTRY_BYTES * (1 + len(self._states))
+
+    def _entry(self, topic_id: int) -> Tuple:
+        return (self._states[topic_id].due, *self.catalog.topics[topic_id].sort_key)
+
+    def _is_current(self, entry: Tuple) -> bool:
+        return self._current.get(entry[-1]) is entry
+
+    def record_read(self, topic_id: int, count: int, last_read_at: Optional[datetime]) -> None:
+        """회독 반영 (O(log n))"""
+        topic = self.catalog.topics.get(topic_id)
+        if topic is None:
+            return
+
+        with self._lock:
+            self._states[topic_id] = ReviewState(
+                count=count,
+                last_read_at=last_read_at,
+                due=due_timestamp(count, last_read_at, topic.importance_level)
+            )
+            entry = self._entry(topic_id)
+            self._current[topic_id] = entry
+            heapq.heappush(self._heap, entry)
+
+            # 버려진 엔트리가 많아지면 힙 재구성
+            if len(self._heap) > 2 * len(self._current):
+                self._heap = list(self._current.values())
+                heapq.heapify(self._heap)
+
+    def peek(self, n: int) -> List[Tuple[ReviewTopic, ReviewState]]:
+        """
+        복습 순서상 앞쪽 n개 (큐는 그대로 유지)
+
+        힙에서는 최대 n개만 꺼냈다 되돌리고, 읽지 않은 토픽 목록은 앞에서부터 읽은 토픽만 건너뜀
+        """
+        topics = self.catalog.topics
+        with self._lock:
+            popped = []
+            result = []
+            unread = (topic for topic in self.catalog.unread_order if topic.id not in self._states)
+            next_unread = next(unread, None)
+
+            while len(result) < n:
+                while self._heap and not self._is_current(self._heap[0]):
+                    heapq.heappop(self._heap)
+
+                head = self._heap[0] if self._heap else None
+                if next_unread is not None and (head is None or (_UNREAD_DUE, *next_unread.sort_key) < head):
+                    result.append((next_unread, UNREAD))
+                    next_unread = next(unread, None)
+                elif head is not None:
+                    popped.append(heapq.heappop(self._heap))
+                    result.append((topics[head[-1]], self._states[head[-1]]))
+                else:
+                    break
+
+            for entry in popped:
+                heapq.heappush(self._heap, entry)
+            return result
+
+
+# 공개 토픽 카탈로그 (토픽 버전 스탬프 단위로 공유)
+_catalog_lock = threading.Lock()
+_catalog: Optional[ReviewCatalog] = None
+
+# 사용자별 복습 큐 (버전/TTL은 ReviewQueue가 직접 보관)
+review_queues = LRUCache(max_bytes=settings.REVIEW_QUEUE_CACHE_MAX_BYTES, name="review-queue")
+
+
+def _review_catalog(db: Session, version: int) -> ReviewCatalog:
+    global _catalog
+
+    cached = _catalog
+    if cached is not None and cached.version == version:
+        return cached
+
+    rows = db.query(
+        Topic.id,
+        Topic.title,
+        Topic.category_id,
+        Topic.importance_level,
+        Topic.order_index
+    ).filter(Topic.is_published.is_(True)).all()
+    catalog = ReviewCatalog(version, {
+        row.id: ReviewTopic(
+            id=row.id,
+            title=row.title,
+            category_id=row.category_id,
+            importance_level=row.importance_level,
+            order_index=row.order_index or 0
+        )
+        for row in rows
+    })
+
+    with _catalog_lock:
+        _catalog = catalog
+    return catalog
+
+
+def get_review_queue(db: Session, user_id: UUID, version: int) -> ReviewQueue:
+    """
+    사용자의 복습 큐 반환
+
+    토픽 버전 스탬프가 바뀌었거나 REVIEW_QUEUE_TTL_SECONDS가 지났으면 다시 구성
+    (다른 워커에서 기록된 회독을 반영하기 위해 TTL 사용)
+    """
+    queue = review_queues.get(user_id)
+    if (
+        queue is not None
+        and queue.version == version
+        and time.monotonic() - queue.built_at < settings.REVIEW_QUEUE_TTL_SECONDS
+    ):
+        return queue
+
+    catalog = _review_catalog(db, version)
+    rows = db.query(
+        UserReadCount.topic_id,
+        UserReadCount.count,
+        UserReadCount.last_read_at
+    ).filter(UserReadCount.user_id == user_id, UserReadCount.count > 0).all()
+
+    # 공개 토픽 중 읽은 것만 사용자 큐에 보관
+    states = {
+        row.topic_id: ReviewState(
+            count=row.count,
+            last_read_at=row.last_read_at,
+            due=due_timestamp(row.count, row.last_read_at, catalog.topics[row.topic_id].importance_level)
+        )
+        for row in rows
+        if row.topic_id in catalog.topics
+    }
+
+    queue = ReviewQueue(catalog, states)
+    review_queues.set(user_id, queue, size=queue.size)
+    return queue
+
+
+def record_read(user_id: UUID, topic_id: int, count: int, last_read_at: Optional[datetime]) -> None:
+    """회독 기록 후 호출 - 캐시된 큐가 있으면 해당 토픽만 갱신 (DB 접근 없음)"""
+    queue = review_queues.get(user_id)
+    if queue is not None:
+        queue.record_read(topic_id, count, last_read_at)
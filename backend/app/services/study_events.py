@@ -0,0 +1,277 @@
+import logging
+import threading
+from datetime import date, datetime, timedelta
+from typing import Iterable, Optional, Set, Tuple
+from uuid import UUID
+from zoneinfo import ZoneInfo
+
+from sqlalchemy import Date, Integer, String, TIMESTAMP, cast, column, func, insert, literal, select, text, tuple_, update, values
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID, insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models.study_event import StudyEvent, StudyDailyRollup
+from app.models.topic import Topic
+
+logger = logging.getLogger(__name__)
+
+# check_violation: 기본 파티션에 이미 해당 범위의 행이 있어 새 파티션을 붙일 수 없음
+_PG_CHECK_VIOLATION = "23514"
+
+# 이벤트 종류
+READ = "read"
+BOOKMARK = "bookmark"
+NOTE = "note"
+
+_EVENT_COLUMNS = ["user_id", "topic_id", "category_id", "event_type", "amount", "occurred_at"]
+
+
+def record_event(db: Session, user_id: UUID, topic_id: int, event_type: str, amount: int = 1) -> None:
+    """
+    학습 이벤트 기록 (커밋은 호출하는 쪽 트랜잭션과 함께)
+
+    카테고리는 INSERT ... SELECT로 토픽에서 바로 가져오므로 추가 조회 없음
+    """
+    source = select(
+        literal(user_id, PG_UUID(as_uuid=True)),
+        Topic.id,
+        Topic.category_id,
+        literal(event_type, String),
+        literal(amount, Integer),
+        func.current_timestamp()
+    ).where(Topic.id == topic_id)
+    db.execute(insert(StudyEvent.__table__).from_select(_EVENT_COLUMNS, source))
+
+
+def record_events(
+    db: Session,
+    user_id: UUID,
+    event_type: str,
+    events: Iterable[Tuple[int, int, Optional[datetime]]]
+) -> None:
+    """
+    (topic_id, amount, occurred_at) 여러 건을 한 번의 INSERT로 기록
+
+    occurred_at이 없으면 서버 시각, 미래 시각은 서버 시각으로 제한, 없는 토픽은 무시
+    """
+    events = list(events)
+    if not events:
+        return
+
+    rows = values(
+        column("topic_id", Integer),
+        column("amount", Integer),
+        column("occurred_at", TIMESTAMP),
+        name="events"
+    ).data(events)
+
+    now = func.current_timestamp()
+    source = select(
+        literal(user_id, PG_UUID(as_uuid=True)),
+        Topic.id,
+        Topic.category_id,
+        literal(event_type, String),
+        rows.c.amount,
+        func.least(func.coalesce(cast(rows.c.occurred_at, TIMESTAMP), now), now)
+    ).select_from(rows).join(Topic, Topic.id == rows.c.topic_id)
+    db.execute(insert(StudyEvent.__table__).from_select(_EVENT_COLUMNS, source))
+
+
+def study_day(value):
+    """UTC TIMESTAMP -> STUDY_TIMEZONE 기준 날짜 (SQL 표현식)"""
+    return cast(func.timezone(settings.STUDY_TIMEZONE, func.timezone("UTC", value)), Date)
+
+
+def today() -> date:
+    """STUDY_TIMEZONE 기준 오늘"""
+    return datetime.now(ZoneInfo(settings.STUDY_TIMEZONE)).date()
+
+
+def _compact_statement(batch_size: int):
+    """
+    미처리 이벤트 batch_size개를 compacted로 표시하면서 그 결과를 그대로 일별 합계에 더하는 한 문장
+
+    WITH batch AS (UPDATE ... SET compacted = TRUE ... RETURNING)
+    INSERT INTO study_daily_rollups SELECT ... FROM batch GROUP BY ... ON CONFLICT DO UPDATE
+    여러 워커가 동시에 실행해도 SKIP LOCKED로 같은 이벤트를 두 번 합산하지 않음
+    """
+    pending = select(StudyEvent.id, StudyEvent.occurred_at).where(
+        StudyEvent.compacted.is_(False)
+    ).order_by(StudyEvent.occurred_at).limit(batch_size).with_for_update(skip_locked=True)
+
+    batch = (
+        update(StudyEvent)
+        .where(tuple_(StudyEvent.id, StudyEvent.occurred_at).in_(pending))
+        .values(compacted=True)
+        .returning(
+            StudyEvent.user_id,
+            StudyEvent.category_id,
+            StudyEvent.event_type,
+            StudyEvent.amount,
+            StudyEvent.occurred_at
+        )
+        .cte("batch")
+    )
+
+    def total(event_type: str):
+        return func.coalesce(func.sum(batch.c.amount).filter(batch.c.event_type == event_type), 0)
+
+    day = study_day(batch.c.occurred_at)
+    category_id = func.coalesce(batch.c.category_id, 0)
+    rollup = select(
+        batch.c.user_id,
+        day,
+        category_id,
+        total(READ),
+        total(BOOKMARK),
+        total(NOTE)
+    ).group_by(batch.c.user_id, day, category_id)
+
+    statement = pg_insert(StudyDailyRollup.__table__).from_select(
+        ["user_id", "day", "category_id", "reads", "bookmarks", "notes"],
+        rollup
+    )
+    return statement.on_conflict_do_update(
+        index_elements=[StudyDailyRollup.user_id, StudyDailyRollup.day, StudyDailyRollup.category_id],
+        set_={
+            "reads": StudyDailyRollup.reads + statement.excluded.reads,
+            "bookmarks": StudyDailyRollup.bookmarks + statement.excluded.bookmarks,
+            "notes": StudyDailyRollup.notes + statement.excluded.notes,
+            "updated_at": func.current_timestamp(),
+        }
+    )
+
+
+class StudyEventCompactor:
+    """
+    학습 이벤트 -> 일별 합계 합산, 오래된 이벤트 삭제, 월별 파티션 생성을 주기적으로 수행하는 스레드
+    """
+
+    # 한 번 실행에서 처리할 최대 batch 수 (밀린 이벤트가 많아도 다른 작업을 오래 막지 않도록)
+    MAX_BATCHES_PER_RUN = 20
+
+    def __init__(self, interval: float, batch_size: int, retention_days: int):
+        self.interval = interval
+        self.batch_size = batch_size
+        self.retention_days = retention_days
+        self._statement = None
+        self._partitioned_month: Optional[date] = None
+        # 기본 파티션에 행이 있어 만들 수 없는 파티션 (다시 시도하지 않음)
+        self._skipped_partitions: Set[str] = set()
+        self._stopping = threading.Event()
+        self._thread = None
+
+    def compact(self) -> int:
+        """미처리 이벤트를 합산하고 갱신된 합계 행 수 반환"""
+        if self._statement is None:
+            self._statement = _compact_statement(self.batch_size)
+
+        updated = 0
+        db = SessionLocal()
+        try:
+            for _ in range(self.MAX_BATCHES_PER_RUN):
+                result = db.execute(self._statement)
+                db.commit()
+                if result.rowcount <= 0:
+                    break
+                updated += result.rowcount
+        except Exception:
+            db.rollback()
+            logger.exception("Failed to compact study events")
+        finally:
+            db.close()
+        return updated
+
+    def expire(self) -> int:
+        """보관 기간이 지난 합산 완료 이벤트 삭제"""
+        db = SessionLocal()
+        try:
+            result = db.query(StudyEvent).filter(
+                StudyEvent.compacted.is_(True),
+                StudyEvent.occurred_at < func.current_timestamp() - timedelta(days=self.retention_days)
+            ).delete(synchronize_session=False)
+            db.commit()
+            return result
+        except Exception:
+            db.rollback()
+            logger.exception("Failed to expire study events")
+            return 0
+        finally:
+            db.close()
+
+    def ensure_partitions(self) -> None:
+        """
+        이번 달과 다음 달 파티션 생성 (occurred_at은 UTC)
+
+        두 파티션이 모두 생성(또는 이미 존재)된 뒤에만 해당 월을 완료로 기록하므로
+        실패하면 다음 주기에 다시 시도 (단, 기본 파티션에 이미 해당 월 행이 있는 경우는 재시도해도
+        계속 실패하므로 한 번만 기록하고 건너뜀 - 그 월의 행은 기본 파티션에 남음)
+        """
+        month = datetime.utcnow().date().replace(day=1)
+        if self._partitioned_month == month:
+            return
+
+        created = True
+        start = month
+        for _ in range(2):
+            next_month = (start + timedelta(days=32)).replace(day=1)
+            name = f"study_events_{start:%Y%m}"
+            if name in self._skipped_partitions:
+                start = next_month
+                continue
+            db = SessionLocal()
+            try:
+                db.execute(text(
+                    f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF study_events "
+                    f"FOR VALUES FROM ('{start.isoformat()}') TO ('{next_month.isoformat()}')"
+                ))
+                db.commit()
+            except Exception as e:
+                db.rollback()
+                if getattr(getattr(e, "orig", None), "pgcode", None) == _PG_CHECK_VIOLATION:
+                    self._skipped_partitions.add(name)
+                    logger.error(
+                        f"Partition {name} skipped: rows for {start:%Y-%m} are already in the default partition"
+                    )
+                else:
+                    created = False
+                    logger.warning(f"Could not create partition {name}: {e}")
+            finally:
+                db.close()
+            start = next_month
+
+        if created:
+            self._partitioned_month = month
+
+    def run_once(self) -> None:
+        self.ensure_partitions()
+        self.compact()
+        self.expire()
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name="study-event-compactor", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """합산 스레드 종료 후 남은 이벤트 합산"""
+        if self._thread is not None:
+            self._stopping.set()
+            self._thread.join()
+            self._thread = None
+        self.compact()
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            self.run_once()
+            self._stopping.wait(self.interval)
+
+
+study_compactor = StudyEventCompactor(
+    interval=settings.STUDY_COMPACT_INTERVAL_SECONDS,
+    batch_size=settings.STUDY_COMPACT_BATCH_SIZE,
+    retention_days=settings.STUDY_EVENT_RETENTION_DAYS,
+)
@@ -0,0 +1,66 @@
+from typing import Dict, Optional, Tuple
+
+from app.core.cache import LRUCache
+from app.core.compression import SplicedBody
+from app.core.config import settings
+from app.models.topic import Topic
+from app.schemas.topic import TopicResponse
+
+# 토픽 상세 응답 캐시: topic_id -> CachedTopic (조회수 제외한 직렬화 본문 + 압축본)
+# 버전 = (updated_at, 카테고리 이름) 이므로 관리자 저장 직후에도 오래된 본문을 반환하지 않음
+topic_cache = LRUCache(max_bytes=settings.TOPIC_CACHE_MAX_BYTES, name="topic-detail")
+
+
+class CachedTopic:
+    """
+    직렬화된 토픽 본문
+
+    조회수는 요청마다 달라지므로 제외하고 마지막 '}'를 뗀 상태로 저장해
+    render()에서 조회수만 덧붙임. 압축본도 인코딩별로 한 번만 만들어 재사용
+    """
+
+    def __init__(self, topic_id: int, version: tuple, payload: bytes):
+        self.topic_id = topic_id
+        self.version = version
+        self.payload = payload
+        self._compressed: Dict[str, SplicedBody] = {}
+
+    @property
+    def size(self) -> int:
+        return len(self.payload) + sum(len(body.prefix) for body in self._compressed.values())
+
+    def render(self, view_count: int, encoding: Optional[str] = None) -> bytes:
+        tail = b',"view_count":%d}' % view_count
+        if encoding is None or len(self.payload) < settings.COMPRESSION_MIN_SIZE:
+            return self.payload + tail
+
+        compressed = self._compressed.get(encoding)
+        if compressed is None:
+            compressed = SplicedBody(self.payload, encoding)
+            self._compressed[encoding] = compressed
+            # 압축본만큼 늘어난 크기를 캐시 메모리 한도에 반영
+            topic_cache.set(self.topic_id, self, size=self.size, version=self.version)
+        return compressed.render(tail)
+
+    def is_compressed(self, encoding: Optional[str]) -> bool:
+        return encoding is not None and len(self.payload) >= settings.COMPRESSION_MIN_SIZE
+
+
+def topic_version(topic: Topic) -> Tuple:
+    return topic.updated_at, topic.category.name if topic.category else None
+
+
+def get_cached(topic_id: int, version: tuple) -> Optional[CachedTopic]:
+    return topic_cache.get(topic_id, version=version)
+
+
+def store(topic: Topic) -> CachedTopic:
+    """토픽을 직렬화해 캐시에 저장"""
+    body = TopicResponse.model_validate(topic).model_dump_json(exclude={"view_count"}).encode()
+    cached = CachedTopic(topic.id, topic_version(topic), body[:-1])
+    topic_cache.set(topic.id, cached, size=cached.size, version=cached.version)
+    return cached
+
+
+def invalidate(topic_id: int) -> None:
+    topic_cache.invalidate(topic_id)
@@ -0,0 +1,128 @@
+import json
+from typing import Dict, List, Optional, Set, Tuple
+from uuid import UUID
+
+from pydantic import ValidationError
+from sqlalchemy import func, insert, or_
+from sqlalchemy.orm import Session
+
+from app.models.category import Category
+from app.models.topic import Topic
+from app.schemas.topic import TopicCreate, TopicImportError
+from app.services.topic_search import search_vector_bulk_expression, search_vector_params
+from app.services.topic_versions import TopicState, initial_version_rows, insert_initial_versions
+
+IMPORT_BATCH_SIZE = 500
+
+# 검색 색인까지 함께 채우는 executemany INSERT (입력 순서대로 id 반환)
+_insert_statement = insert(Topic.__table__).values(
+    search_vector=search_vector_bulk_expression()
+).returning(Topic.__table__.c.id, sort_by_parameter_order=True)
+
+
+class TopicImporter:
+    """
+    NDJSON 서브노트 일괄 가져오기
+
+    한 줄씩 검증해 IMPORT_BATCH_SIZE 단위로 INSERT하며, 커밋은 호출하는 쪽에서 한 번만 수행
+    - 카테고리 존재 여부와 order_index 기본값은 배치마다 한 번의 쿼리로 확인
+    - 잘못된 줄은 건너뛰고 줄 번호와 함께 errors에 기록
+    """
+
+    def __init__(self, db: Session, created_by: UUID):
+        self.db = db
+        self.created_by = created_by
+        self.errors: List[TopicImportError] = []
+        self.topic_ids: List[int] = []
+        self._batch: List[Tuple[int, TopicCreate]] = []
+        self._known_categories: Set[int] = set()
+        self._next_order_index: Dict[Optional[int], int] = {}
+
+    def add_line(self, line_number: int, line: bytes) -> None:
+        line = line.strip()
+        if not line:
+            return
+
+        try:
+            topic_data = TopicCreate.model_validate(json.loads(line))
+        except json.JSONDecodeError as e:
+            self._error(line_number, f"Invalid JSON: {e.msg}")
+            return
+        except ValidationError as e:
+            messages = [f"{'.'.join(str(loc) for loc in err['loc'])}: {err['msg']}" for err in e.errors()]
+            self._error(line_number, "; ".join(messages))
+            return
+        except (TypeError, ValueError) as e:
+            self._error(line_number, str(e))
+            return
+
+        self._batch.append((line_number, topic_data))
+        if len(self._batch) >= IMPORT_BATCH_SIZE:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._batch:
+            return
+
+        batch, self._batch = self._batch, []
+        self._load_categories({data.category_id for _, data in batch if data.category_id})
+        self._load_order_indexes({data.category_id for _, data in batch})
+
+        rows = []
+        states = []
+        for line_number, data in batch:
+            if data.category_id and data.category_id not in self._known_categories:
+                self._error(line_number, f"Category not found: {data.category_id}")
+                continue
+
+            # order_index가 지정되지 않았다면 카테고리의 마지막으로 설정
+            if data.order_index == 0:
+                data.order_index = self._next_order_index[data.category_id]
+            self._next_order_index[data.category_id] = max(
+                self._next_order_index[data.category_id], data.order_index + 1
+            )
+
+            rows.append({
+                **data.model_dump(),
+                "created_by": self.created_by,
+                **search_vector_params(data.title, data.keywords, data.mnemonic, data.content),
+            })
+            states.append(TopicState(data.title, data.keywords, data.mnemonic, data.content))
+
+        if rows:
+            result = self.db.execute(_insert_statement, rows)
+            topic_ids = [row.id for row in result]
+            self.topic_ids.extend(topic_ids)
+            # 수정 이력의 1번 스냅샷
+            insert_initial_versions(self.db, initial_version_rows(topic_ids, states, self.created_by))
+
+    @property
+    def imported(self) -> int:
+        return len(self.topic_ids)
+
+    def _error(self, line_number: int, message: str) -> None:
+        self.errors.append(TopicImportError(line=line_number, message=message))
+
+    def _load_categories(self, category_ids: Set[int]) -> None:
+        missing = category_ids - self._known_categories
+        if missing:
+            found = self.db.query(Category.id).filter(Category.id.in_(missing)).all()
+            self._known_categories.update(row.id for row in found)
+
+    def _load_order_indexes(self, category_ids: Set[Optional[int]]) -> None:
+        missing = category_ids - self._next_order_index.keys()
+        if not missing:
+            return
+
+        conditions = [Topic.category_id.in_([cid for cid in missing if cid is not None])]
+        if None in missing:
+            conditions.append(Topic.category_id.is_(None))
+
+        counts = dict(
+            self.db.query(Topic.category_id, func.count(Topic.id))
+            .filter(or_(*conditions))
+            .group_by(Topic.category_id)
+            .all()
+        )
+        for category_id in missing:
+            self._next_order_index[category_id] = counts.get(category_id, 0)
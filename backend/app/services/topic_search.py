@@ -0,0 +1,158 @@
+import html
+import re
+from typing import Dict, List, Optional
+
+from sqlalchemy import bindparam, func, literal
+
+# 형태소 분석기 없이 한국어를 검색하기 위해 'simple' 설정 + 한글 bi-gram 토큰을 사용
+SEARCH_CONFIG = "simple"
+
+# 가중치: 제목(A) > 키워드(B) > 암기두음법(C) > 본문(D)
+SEARCH_FIELDS = (
+    ("title", "A"),
+    ("keywords", "B"),
+    ("mnemonic", "C"),
+    ("content", "D"),
+)
+
+_WORD_RE = re.compile(r"[^\W_]+")
+_HANGUL_RE = re.compile(r"[가-힣]")
+# 한 단어 안의 한글 구간 / 그 외(영문·숫자 등) 구간 ("TCP를" -> "tcp", "를")
+_SCRIPT_RUN_RE = re.compile(r"[가-힣]+|[^가-힣]+")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def _is_hangul_word(word: str) -> bool:
+    return len(word) > 1 and _HANGUL_RE.search(word) is not None
+
+
+def _bigrams(word: str) -> List[str]:
+    return [word[i:i + 2] for i in range(len(word) - 1)]
+
+
+def _script_runs(text: str) -> List[str]:
+    """단어를 한글 구간과 영문/숫자 구간으로 나눔 (조사가 붙은 영문 용어도 영문 단어로 색인)"""
+    runs = []
+    for word in _WORD_RE.findall(text.lower()):
+        runs.extend(_SCRIPT_RUN_RE.findall(word))
+    return runs
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """
+    검색용 토큰 생성
+
+    - 영문/숫자 구간: 소문자 단어 그대로 ("TCP를" -> "tcp")
+    - 한글 구간: 2글자씩 겹치는 bi-gram (조사가 붙어도 부분 일치 가능)
+    """
+    if not text:
+        return []
+
+    tokens = []
+    for run in _script_runs(text):
+        tokens.extend(_bigrams(run) if _is_hangul_word(run) else [run])
+    return tokens
+
+
+def _field_vector(value):
+    return func.to_tsvector(SEARCH_CONFIG, value)
+
+
+def search_vector_expression(
+    title: Optional[str],
+    keywords: Optional[str],
+    mnemonic: Optional[str],
+    content: Optional[str],
+):
+    """
+    Topic.search_vector에 저장할 가중치 tsvector SQL 표현식 (단건 저장용)
+    """
+    values = {"title": title, "keywords": keywords, "mnemonic": mnemonic, "content": content}
+    expression = None
+    for field, weight in SEARCH_FIELDS:
+        part = func.setweight(_field_vector(literal(" ".join(tokenize(values[field])))), weight)
+        expression = part if expression is None else expression.op("||")(part)
+    return expression
+
+
+def search_vector_bulk_expression():
+    """
+    executemany용 tsvector 표현식 (값은 search_vector_params()로 바인딩)
+    """
+    expression = None
+    for field, weight in SEARCH_FIELDS:
+        part = func.setweight(_field_vector(bindparam(f"sv_{field}")), weight)
+        expression = part if expression is None else expression.op("||")(part)
+    return expression
+
+
+def search_vector_params(
+    title: Optional[str],
+    keywords: Optional[str],
+    mnemonic: Optional[str],
+    content: Optional[str],
+) -> Dict[str, str]:
+    """
+    search_vector_bulk_expression()에 바인딩할 토큰 문자열
+    """
+    values = {"title": title, "keywords": keywords, "mnemonic": mnemonic, "content": content}
+    return {f"sv_{field}": " ".join(tokenize(values[field])) for field, _ in SEARCH_FIELDS}
+
+
+def build_tsquery(search: str) -> Optional[str]:
+    """
+    검색어를 to_tsquery 문법으로 변환 (모든 토큰 AND)
+
+    - 영문/숫자 구간과 한 글자 한글은 접두사 검색(:*), 색인과 같은 방식으로 구간을 나눔
+    - 토큰이 하나도 없으면 None
+    """
+    terms = []
+    for run in _script_runs(search):
+        terms.extend(_bigrams(run) if _is_hangul_word(run) else [f"{run}:*"])
+
+    if not terms:
+        return None
+    # 중복 제거 (순서 유지)
+    return " & ".join(dict.fromkeys(terms))
+
+
+def tsquery_expression(query: str):
+    return func.to_tsquery(SEARCH_CONFIG, query)
+
+
+def build_snippet(search: str, *texts: Optional[str], width: int = 120) -> Optional[str]:
+    """
+    검색어가 처음 등장하는 부분 주변을 잘라 <mark>로 강조한 스니펫 생성
+
+    HTML 이스케이프 후 <mark> 태그만 추가하므로 클라이언트에서 그대로 렌더링 가능
+    """
+    words = sorted(set(_WORD_RE.findall(search.lower())), key=len, reverse=True)
+    if not words:
+        return None
+
+    pattern = re.compile("|".join(re.escape(word) for word in words), re.IGNORECASE)
+    for text in texts:
+        if not text:
+            continue
+        text = _WHITESPACE_RE.sub(" ", text).strip()
+        match = pattern.search(text)
+        if not match:
+            continue
+
+        start = max(0, match.start() - width // 3)
+        end = min(len(text), start + width)
+        fragment = text[start:end]
+
+        highlighted = []
+        position = 0
+        for hit in pattern.finditer(fragment):
+            highlighted.append(html.escape(fragment[position:hit.start()]))
+            highlighted.append(f"<mark>{html.escape(hit.group())}</mark>")
+            position = hit.end()
+        highlighted.append(html.escape(fragment[position:]))
+
+        prefix = "…" if start > 0 else ""
+        suffix = "…" if end < len(text) else ""
+        return f"{prefix}{''.join(highlighted)}{suffix}"
+
+    return None
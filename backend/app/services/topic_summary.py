@@ -0,0 +1,69 @@
+from typing import Iterable, List
+
+from pydantic import TypeAdapter
+from sqlalchemy.orm import Session
+
+from app.models.category import Category
+from app.models.topic import Topic
+from app.schemas.topic import CategoryInfo, TopicListItem
+
+# 목록/요약 경로에서 조회하는 컬럼 (본문 content, search_vector는 절대 읽지 않음)
+TOPIC_SUMMARY_COLUMNS = (
+    Topic.id,
+    Topic.title,
+    Topic.category_id,
+    Category.name.label("category_name"),
+    Topic.is_published,
+    Topic.view_count,
+    Topic.importance_level,
+    Topic.keywords,
+    Topic.mnemonic,
+    Topic.comments_count,
+    Topic.order_index,
+    Topic.created_at,
+    Topic.updated_at,
+)
+
+_list_adapter = TypeAdapter(List[TopicListItem])
+
+
+def topic_summary_query(db: Session, *extra_columns):
+    """토픽 요약 컬럼 projection 쿼리 (카테고리 이름은 LEFT JOIN)"""
+    return db.query(*TOPIC_SUMMARY_COLUMNS, *extra_columns).outerjoin(
+        Category, Category.id == Topic.category_id
+    )
+
+
+def to_list_item(row) -> TopicListItem:
+    """
+    projection 행 -> TopicListItem
+
+    DB에서 읽은 값이므로 검증 없이 model_construct로 생성
+    """
+    category = None
+    if row.category_id is not None and row.category_name is not None:
+        category = CategoryInfo.model_construct(id=row.category_id, name=row.category_name)
+
+    return TopicListItem.model_construct(
+        id=row.id,
+        title=row.title,
+        category_id=row.category_id,
+        category=category,
+        is_published=row.is_published,
+        view_count=row.view_count or 0,
+        importance_level=row.importance_level,
+        keywords=row.keywords,
+        mnemonic=row.mnemonic,
+        comments_count=row.comments_count or 0,
+        created_at=row.created_at,
+        updated_at=row.updated_at,
+    )
+
+
+def dump_list_items(rows: Iterable) -> bytes:
+    """projection 행들을 TopicListItem 배열 JSON으로 바로 직렬화"""
+    return _list_adapter.dump_json([to_list_item(row) for row in rows])
+
+
+def dump_list_item(row) -> bytes:
+    return to_list_item(row).model_dump_json().encode()
@@ -0,0 +1,225 @@
+import difflib
+import json
+import re
+from dataclasses import dataclass
+from typing import List, Optional
+from uuid import UUID
+
+from sqlalchemy import func, insert
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.topic import Topic
+from app.models.topic_version import TopicVersion
+
+# 줄바꿈/문장부호 단위로 나눠 diff (JSON 본문처럼 줄이 긴 경우에도 delta가 작게 유지되도록)
+_SEGMENT_RE = re.compile(r"[^\n.,;]*[\n.,;]|[^\n.,;]+")
+
+
+@dataclass
+class TopicState:
+    """버전으로 기록되는 토픽 필드"""
+    title: str
+    keywords: Optional[str]
+    mnemonic: Optional[str]
+    content: str
+
+    @classmethod
+    def of(cls, topic) -> "TopicState":
+        return cls(topic.title, topic.keywords, topic.mnemonic, topic.content)
+
+
+@dataclass
+class ReconstructedVersion(TopicState):
+    version: int
+    is_snapshot: bool
+    created_by: Optional[UUID]
+    created_at: object
+    applied_deltas: int
+
+
+def _segments(text: str) -> List[str]:
+    return _SEGMENT_RE.findall(text)
+
+
+def encode_delta(base: str, target: str) -> str:
+    """
+    base -> target 변환 delta (JSON 배열)
+
+    - 양수 n: base에서 n개 세그먼트 복사
+    - 음수 -n: base에서 n개 세그먼트 건너뜀
+    - 문자열: 그대로 삽입
+    """
+    base_segments = _segments(base)
+    target_segments = _segments(target)
+    matcher = difflib.SequenceMatcher(None, base_segments, target_segments, autojunk=False)
+
+    ops = []
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            ops.append(i2 - i1)
+            continue
+        if i2 > i1:
+            ops.append(-(i2 - i1))
+        if j2 > j1:
+            ops.append("".join(target_segments[j1:j2]))
+
+    return json.dumps(ops, ensure_ascii=False, separators=(",", ":"))
+
+
+def apply_delta(base: str, delta: str) -> str:
+    segments = _segments(base)
+    position = 0
+    output = []
+
+    for op in json.loads(delta):
+        if isinstance(op, str):
+            output.append(op)
+        elif op >= 0:
+            output.extend(segments[position:position + op])
+            position += op
+        else:
+            position -= op
+
+    return "".join(output)
+
+
+def record_version(
+    db: Session,
+    topic: Topic,
+    created_by: Optional[UUID],
+    previous: Optional[TopicState] = None
+) -> int:
+    """
+    현재 토픽 상태를 새 버전으로 기록하고 버전 번호 반환 (커밋은 호출하는 쪽에서)
+
+    previous: 수정 전 상태. 이력이 없는 기존 토픽이면 이를 먼저 1번 스냅샷으로 남김
+
+    토픽 행을 잠근 뒤 번호를 매기므로 동시에 저장해도 같은 번호로 충돌하지 않음
+    (delta 기준이 되는 previous도 정확하려면 호출하는 쪽에서 토픽을 FOR UPDATE로 읽어야 함)
+    """
+    db.query(Topic.id).filter(Topic.id == topic.id).with_for_update().one()
+
+    latest_version, latest_snapshot = db.query(
+        func.max(TopicVersion.version),
+        func.max(TopicVersion.version).filter(TopicVersion.is_snapshot.is_(True))
+    ).filter(TopicVersion.topic_id == topic.id).one()
+
+    if latest_version is None and previous is not None:
+        _add_version(db, topic.id, 1, previous, previous.content, True, created_by)
+        latest_version = latest_snapshot = 1
+
+    current = TopicState.of(topic)
+    if latest_version is None:
+        _add_version(db, topic.id, 1, current, current.content, True, created_by)
+        return 1
+
+    version = latest_version + 1
+    # N개 버전마다 스냅샷 -> 어떤 버전이든 최대 N-1개의 delta만 적용하면 복원 가능
+    if previous is None or version - latest_snapshot >= settings.TOPIC_VERSION_SNAPSHOT_INTERVAL:
+        _add_version(db, topic.id, version, current, current.content, True, created_by)
+    else:
+        delta = encode_delta(previous.content, current.content)
+        _add_version(db, topic.id, version, current, delta, False, created_by)
+    return version
+
+
+def initial_version_rows(topic_ids: List[int], states: List[TopicState], created_by: Optional[UUID]) -> List[dict]:
+    """일괄 생성된 토픽들의 1번 스냅샷 행 (executemany용)"""
+    return [
+        {
+            "topic_id": topic_id,
+            "version": 1,
+            "is_snapshot": True,
+            "title": state.title,
+            "keywords": state.keywords,
+            "mnemonic": state.mnemonic,
+            "content_data": state.content,
+            "content_length": len(state.content),
+            "created_by": created_by,
+        }
+        for topic_id, state in zip(topic_ids, states)
+    ]
+
+
+def insert_initial_versions(db: Session, rows: List[dict]) -> None:
+    if rows:
+        db.execute(insert(TopicVersion.__table__), rows)
+
+
+def _add_version(
+    db: Session,
+    topic_id: int,
+    version: int,
+    state: TopicState,
+    content_data: str,
+    is_snapshot: bool,
+    created_by: Optional[UUID]
+) -> None:
+    db.add(TopicVersion(
+        topic_id=topic_id,
+        version=version,
+        is_snapshot=is_snapshot,
+        title=state.title,
+        keywords=state.keywords,
+        mnemonic=state.mnemonic,
+        content_data=content_data,
+        content_length=len(state.content),
+        created_by=created_by,
+    ))
+
+
+def reconstruct(db: Session, topic_id: int, version: int) -> Optional[ReconstructedVersion]:
+    """
+    특정 버전 복원
+
+    직전 스냅샷부터 요청 버전까지의 행만 한 번의 쿼리로 읽어 delta를 순서대로 적용
+    """
+    base_snapshot = db.query(func.max(TopicVersion.version)).filter(
+        TopicVersion.topic_id == topic_id,
+        TopicVersion.version <= version,
+        TopicVersion.is_snapshot.is_(True)
+    ).scalar_subquery()
+
+    rows = db.query(TopicVersion).filter(
+        TopicVersion.topic_id == topic_id,
+        TopicVersion.version >= base_snapshot,
+        TopicVersion.version <= version
+    ).order_by(TopicVersion.version).all()
+
+    if not rows or rows[-1].version != version:
+        return None
+
+    content = rows[0].content_data
+    for row in rows[1:]:
+        content = apply_delta(content, row.content_data)
+
+    target = rows[-1]
+    return ReconstructedVersion(
+        title=target.title,
+        keywords=target.keywords,
+        mnemonic=target.mnemonic,
+        content=content,
+        version=target.version,
+        is_snapshot=target.is_snapshot,
+        created_by=target.created_by,
+        created_at=target.created_at,
+        applied_deltas=len(rows) - 1,
+    )
+
+
+def diff_versions(old: TopicState, new: TopicState, old_label: str, new_label: str) -> str:
+    """두 버전의 unified diff (제목/키워드/암기두음법/본문)"""
+    def lines(state: TopicState) -> List[str]:
+        header = [
+            f"# title: {state.title}\n",
+            f"# keywords: {state.keywords or ''}\n",
+            f"# mnemonic: {state.mnemonic or ''}\n",
+            "\n",
+        ]
+        content = state.content.splitlines(keepends=True)
+        if content and not content[-1].endswith("\n"):
+            content[-1] += "\n"
+        return header + content
+
+    return "".join(difflib.unified_diff(lines(old), lines(new), fromfile=old_label, tofile=new_label))
@@ -0,0 +1,61 @@
+"""
+Recompute denormalized counters from their source tables
+"""
+from sqlalchemy import func, select, update
+
+from app.core.database import SessionLocal
+from app.models.comment import Comment, CommentLike
+from app.models.topic import Topic
+
+
+def reconcile_topic_comments_count(db) -> int:
+    """topics.comments_count = comments 행 수"""
+    actual = select(func.count(Comment.id)).where(
+        Comment.topic_id == Topic.id
+    ).scalar_subquery()
+
+    result = db.execute(
+        update(Topic)
+        .where(func.coalesce(Topic.comments_count, -1) != actual)
+        .values(comments_count=actual, updated_at=Topic.updated_at)
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount
+
+
+def reconcile_comment_likes_count(db) -> int:
+    """comments.likes_count = comment_likes 행 수"""
+    actual = select(func.count(CommentLike.comment_id)).where(
+        CommentLike.comment_id == Comment.id
+    ).scalar_subquery()
+
+    result = db.execute(
+        update(Comment)
+        .where(func.coalesce(Comment.likes_count, -1) != actual)
+        .values(likes_count=actual, updated_at=Comment.updated_at)
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount
+
+
+def reconcile_counters():
+    db = SessionLocal()
+
+    try:
+        fixed = reconcile_topic_comments_count(db)
+        print(f"topics.comments_count: fixed {fixed} rows")
+
+        fixed = reconcile_comment_likes_count(db)
+        print(f"comments.likes_count: fixed {fixed} rows")
+
+        db.commit()
+
+    except Exception as e:
+        print(f"Error: {e}")
+        db.rollback()
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    reconcile_counters()
@@ -0,0 +1,56 @@
+"""
+Rebuild topics.search_vector for every topic
+"""
+from sqlalchemy import bindparam, update
+
+from app.core.database import SessionLocal
+from app.models.topic import Topic
+from app.services.topic_search import search_vector_bulk_expression, search_vector_params
+
+BATCH_SIZE = 200
+
+
+def reindex_topic_search():
+    db = SessionLocal()
+
+    try:
+        rows = db.query(
+            Topic.id, Topic.title, Topic.keywords, Topic.mnemonic, Topic.content
+        ).order_by(Topic.id).yield_per(BATCH_SIZE)
+
+        statement = update(Topic.__table__).where(
+            Topic.__table__.c.id == bindparam("topic_id")
+        ).values(
+            search_vector=search_vector_bulk_expression(),
+            # 색인 재생성은 내용 변경이 아니므로 updated_at 유지
+            updated_at=Topic.__table__.c.updated_at,
+        )
+
+        batch = []
+        total = 0
+        for row in rows:
+            batch.append({
+                "topic_id": row.id,
+                **search_vector_params(row.title, row.keywords, row.mnemonic, row.content),
+            })
+            if len(batch) >= BATCH_SIZE:
+                db.connection().execute(statement, batch)
+                total += len(batch)
+                batch = []
+
+        if batch:
+            db.connection().execute(statement, batch)
+            total += len(batch)
+
+        db.commit()
+        print(f"Reindexed {total} topics")
+
+    except Exception as e:
+        print(f"Error: {e}")
+        db.rollback()
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    reindex_topic_search()
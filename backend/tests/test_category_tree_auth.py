@@ -0,0 +1,54 @@
+import os
+
+os.environ.setdefault("DATABASE_URL", "postgresql://u:p@localhost/db")
+os.environ.setdefault("SECRET_KEY", "test")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app.api.routes import categories  # noqa: E402
+from app.core.database import get_db  # noqa: E402
+from app.main import app  # noqa: E402
+
+
+class _Tree:
+    payload = b"[]"
+
+
+def _client(monkeypatch) -> TestClient:
+    monkeypatch.setattr(categories, "get_version", lambda db, name: (1, None))
+    monkeypatch.setattr(categories.category_tree, "get_category_tree", lambda db, version=None: _Tree())
+    monkeypatch.setattr(
+        categories.category_tree, "get_category_tree_with_counts", lambda db, *args: b"[]"
+    )
+    app.dependency_overrides[get_db] = lambda: None
+    return TestClient(app)
+
+
+def test_tree_ignores_invalid_bearer_token(monkeypatch):
+    client = _client(monkeypatch)
+    try:
+        response = client.get("/api/categories/tree", headers={"Authorization": "Bearer garbage"})
+        assert response.status_code == 200
+        assert response.json() == []
+
+        response = client.get(
+            "/api/categories/tree?with_counts=true", headers={"Authorization": "Bearer garbage"}
+        )
+        assert response.status_code == 200
+    finally:
+        app.dependency_overrides.clear()
+
+
+def test_tree_unpublished_counts_require_admin(monkeypatch):
+    client = _client(monkeypatch)
+    try:
+        response = client.get("/api/categories/tree?with_counts=true&include_unpublished=true")
+        assert response.status_code == 401
+
+        response = client.get(
+            "/api/categories/tree?with_counts=true&include_unpublished=true",
+            headers={"Authorization": "Bearer garbage"}
+        )
+        assert response.status_code == 401
+    finally:
+        app.dependency_overrides.clear()
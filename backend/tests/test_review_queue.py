@@ -0,0 +1,48 @@
+import os
+from datetime import datetime, timedelta
+
+os.environ.setdefault("DATABASE_URL", "postgresql://u:p@localhost/db")
+os.environ.setdefault("SECRET_KEY", "test")
+
+from app.services.review_queue import (  # noqa: E402
+    REVIEW_MAX_INTERVAL_DAYS, UNREAD, ReviewCatalog, ReviewQueue, ReviewState, ReviewTopic, due_timestamp,
+    review_interval
+)
+
+
+def test_interval_doubles_per_read():
+    assert review_interval(2, 3) == review_interval(1, 3) * 2
+
+
+def test_interval_is_capped_for_large_counts():
+    for count in (30, 1025, 10 ** 6):
+        for importance in (1, 3, 5):
+            assert review_interval(count, importance) == timedelta(days=REVIEW_MAX_INTERVAL_DAYS)
+
+
+def test_queue_accepts_large_count():
+    topics = {1: ReviewTopic(1, "a", None, 5, 0), 2: ReviewTopic(2, "b", None, 3, 1)}
+    queue = ReviewQueue(ReviewCatalog(1, topics), {})
+
+    now = datetime.utcnow()
+    queue.record_read(1, 10 ** 6, now)
+
+    assert [topic.id for topic, _ in queue.peek(2)] == [2, 1]
+    assert queue.peek(2)[1][1].due == due_timestamp(10 ** 6, now, 5)
+
+
+def test_unread_topics_come_from_shared_catalog():
+    topics = {topic_id: ReviewTopic(topic_id, str(topic_id), None, 3, topic_id) for topic_id in range(1, 5)}
+    catalog = ReviewCatalog(1, topics)
+    now = datetime.utcnow()
+    read = ReviewState(1, now, due_timestamp(1, now, 3))
+    queue = ReviewQueue(catalog, {2: read})
+    other = ReviewQueue(catalog, {})
+
+    # 사용자 큐에는 읽은 토픽만, 읽지 않은 토픽이 먼저 나옴
+    assert [(topic.id, state) for topic, state in queue.peek(4)] == [(1, UNREAD), (3, UNREAD), (4, UNREAD), (2, read)]
+
+    queue.record_read(1, 1, now - timedelta(days=30))
+    assert [topic.id for topic, _ in queue.peek(2)] == [3, 4]
+    assert [topic.id for topic, _ in queue.peek(4)] == [3, 4, 1, 2]
+    assert [topic.id for topic, _ in other.peek(4)] == [1, 2, 3, 4]
@@ -0,0 +1,26 @@
+import os
+
+os.environ.setdefault("DATABASE_URL", "postgresql://u:p@localhost/db")
+os.environ.setdefault("SECRET_KEY", "test")
+
+from app.services.topic_search import build_tsquery, tokenize  # noqa: E402
+
+
+def test_particle_suffixed_english_term_is_indexed_as_word():
+    tokens = tokenize("TCP를 사용한 SQL문")
+
+    assert "tcp" in tokens
+    assert "sql" in tokens
+    assert "p를" not in tokens and "l문" not in tokens
+    assert tokens == ["tcp", "를", "사용", "용한", "sql", "문"]
+
+
+def test_english_query_matches_particle_suffixed_term():
+    # 질의 "TCP"의 접두사 토큰이 "TCP를"의 색인 토큰과 일치
+    assert build_tsquery("TCP") == "tcp:*"
+    assert "tcp" in tokenize("TCP를")
+
+
+def test_mixed_script_query_splits_like_index():
+    assert build_tsquery("SQL문") == "sql:* & 문:*"
+    assert build_tsquery("데이터베이스") == "데이 & 이터 & 터베 & 베이 & 이스"
@@ -4,6 +4,13 @@ export interface Bookmark {
   user_id: string
   topic_id: number
   created_at: string
+  title: string
+  category_id: number | null
+  category: { id: number; name: string } | null
+  importance_level: number
+  is_published: boolean
+  read_count: number
+  last_read_at: string | null
 }
 
 export const bookmarksApi = {
@@ -15,6 +22,14 @@ export const bookmarksApi = {
     return response.json()
   },
 
+  getIds: async (token: string): Promise<number[]> => {
+    const response = await fetch(`${API_URL}/api/bookmarks/ids`, {
+      headers: { 'Authorization': `Bearer ${token}` },
+    })
+    if (!response.ok) throw new Error('Failed to fetch bookmark ids')
+    return response.json()
+  },
+
   toggle: async (topicId: number, token: string): Promise<{ is_bookmarked: boolean }> => {
     const response = await fetch(`${API_URL}/api/bookmarks`, {
       method: 'POST',
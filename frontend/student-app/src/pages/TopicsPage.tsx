@@ -86,9 +86,8 @@ export default function TopicsPage() {
   const loadBookmarks = async () => {
     if (!token) return
     try {
-      const bookmarks = await bookmarksApi.getAll(token)
-      const ids = new Set(bookmarks.map(b => b.topic_id))
-      setBookmarkedTopicIds(ids)
+      const ids = await bookmarksApi.getIds(token)
+      setBookmarkedTopicIds(new Set(ids))
     } catch (err) {
       console.error('Failed to load bookmarks:', err)
     }